@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Measure the middleware overhead of an API request.
+
+Compares the middleware chain of an API request with the full chain that API
+requests used to pass through (``NON_API_MIDDLEWARE`` in place of the
+``NonAPIMiddleware``). The requests go to a view that does nothing, so only
+the middleware is measured.
+
+Usage:
+
+    $ DJANGO_SETTINGS_MODULE=verzoeken.conf.dev python bin/benchmark_middleware.py
+"""
+import os
+import sys
+import timeit
+
+import django
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import path
+
+NUMBER = 10000
+
+urlpatterns = [path("api/v1/benchmark", lambda request: HttpResponse())]
+
+
+def get_handler(middleware) -> BaseHandler:
+    with override_settings(MIDDLEWARE=middleware):
+        handler = BaseHandler()
+        handler.load_middleware()
+    return handler
+
+
+def benchmark(middleware) -> float:
+    handler = get_handler(middleware)
+    request_factory = RequestFactory()
+
+    def request():
+        response = handler.get_response(request_factory.get("/api/v1/benchmark"))
+        assert response.status_code == 200, response
+
+    return timeit.timeit(request, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+    django.setup()
+
+    full_middleware = []
+    for middleware_path in settings.MIDDLEWARE:
+        if middleware_path == "verzoeken.utils.middleware.NonAPIMiddleware":
+            full_middleware += settings.NON_API_MIDDLEWARE
+        else:
+            full_middleware.append(middleware_path)
+
+    with override_settings(ROOT_URLCONF=__name__, ALLOWED_HOSTS=["*"]):
+        api = benchmark(settings.MIDDLEWARE)
+        full = benchmark(full_middleware)
+
+    print(f"API middleware:  {api:7.1f} µs per request")
+    print(f"Full middleware: {full:7.1f} µs per request")
+    print(f"Saved:           {full - api:7.1f} µs per request")
+
+
+if __name__ == "__main__":
+    main()
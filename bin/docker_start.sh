@@ -33,15 +33,6 @@ if [ -d $fixtures_dir ]; then
     done
 fi
 
-# Start server
+# Start server, see uwsgi.ini for the configuration
 >&2 echo "Starting server"
-uwsgi \
-    --http :$uwsgi_port \
-    --module verzoeken.wsgi \
-    --static-map /static=/app/static \
-    --static-map /media=/app/media  \
-    --chdir src \
-    --processes 2 \
-    --threads 2 \
-    --buffer-size=32768
-    # processes & threads are needed for concurrency without nginx sitting inbetween
+uwsgi --ini /app/uwsgi.ini --http :$uwsgi_port
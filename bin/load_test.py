@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of the uWSGI configuration for a number of workers.
+
+Starts uWSGI with ``bin/uwsgi.ini`` for every number of processes, and sends
+requests from a number of client processes for a while. Run it on the machine
+that's sized, the throughput should go up with the number of processes until
+the CPU cores (or the database) are saturated.
+
+The API requires credentials, see the ``Applicatie`` in the admin (or use a
+URL that doesn't, like ``/api/v1/schema/openapi.json``).
+
+Usage:
+
+    $ DJANGO_SETTINGS_MODULE=verzoeken.conf.dev python bin/load_test.py \\
+        --client-id load-test --secret secret --processes 1 2 4 8
+"""
+import argparse
+import os
+import signal
+import subprocess
+import time
+from multiprocessing import Pool
+
+import requests
+from zds_client import ClientAuth
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+def start_server(processes: int, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        UWSGI_PROCESSES=str(processes),
+        # keep all workers running, so they're all measured
+        UWSGI_CHEAPER="0",
+    )
+    server = subprocess.Popen(
+        ["uwsgi", "--ini", "bin/uwsgi.ini", "--http", f":{port}"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    url = f"http://localhost:{port}/_health/ready"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url).status_code == 200:
+                return server
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.5)
+
+    stop_server(server)
+    raise RuntimeError("uWSGI isn't ready after 60 seconds")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGTERM)
+    server.wait()
+
+
+def run_client(args) -> list:
+    url, headers, duration = args
+    durations = []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.monotonic()
+        # a new connection for every request, the uWSGI HTTP router closes them
+        response = requests.get(url, headers=headers)
+        response.raise_for_status()
+        durations.append(time.monotonic() - start)
+    return durations
+
+
+def percentile(durations: list, percent: int) -> float:
+    return durations[min(len(durations) * percent // 100, len(durations) - 1)]
+
+
+def load_test(url: str, headers: dict, clients: int, duration: float) -> list:
+    with Pool(clients) as pool:
+        results = pool.map(run_client, [(url, headers, duration)] * clients)
+    return sorted(request_duration for result in results for request_duration in result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="/api/v1/verzoeken")
+    parser.add_argument("--client-id")
+    parser.add_argument("--secret")
+    parser.add_argument(
+        "--processes", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() * 2}),
+    )
+    parser.add_argument("--clients", type=int, default=os.cpu_count() * 4)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--port", type=int, default=8123)
+    args = parser.parse_args()
+
+    headers = {"Accept-Crs": "EPSG:4326"}
+    if args.client_id:
+        headers.update(ClientAuth(args.client_id, args.secret).credentials())
+
+    print(f"{os.cpu_count()} CPU cores, {args.clients} clients, {args.url}")
+    print("processes  requests/s  p50 (ms)  p99 (ms)")
+    for processes in args.processes:
+        server = start_server(processes, args.port)
+        try:
+            durations = load_test(
+                f"http://localhost:{args.port}{args.url}",
+                headers,
+                args.clients,
+                args.duration,
+            )
+        finally:
+            stop_server(server)
+
+        print(
+            f"{processes:9}  {len(durations) / args.duration:10.1f}"
+            f"  {percentile(durations, 50) * 1000:8.1f}"
+            f"  {percentile(durations, 99) * 1000:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
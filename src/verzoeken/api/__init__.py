@@ -0,0 +1 @@
+default_app_config = "verzoeken.api.apps.ApiConfig"
@@ -1,13 +1,99 @@
 import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
 
 from vng_api_common.models import APICredential
+from zds_client import ClientAuth
 
 logger = logging.getLogger(__name__)
 
 
+def get_origin(url: str) -> str:
+    split_url = urlsplit(url)
+    return urlunsplit(split_url[:2] + ("", "", ""))
+
+
+class CredentialIndex:
+    """
+    In-process index of the ``APICredential`` API roots, grouped by origin.
+
+    Mirrors the lookup of ``APICredential.get_auth`` - the longest API root
+    that prefixes the URL wins - without querying the database. The index is
+    dropped when credentials change in this process (see ``signals``) and
+    reloaded after ``API_CREDENTIAL_INDEX_TIMEOUT`` seconds to pick up
+    changes made by other processes.
+    """
+
+    def __init__(self):
+        self._index = None
+        self._loaded = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, List[APICredential]]:
+        index = defaultdict(list)
+        for credential in APICredential.objects.all():
+            index[get_origin(credential.api_root)].append(credential)
+
+        for candidates in index.values():
+            candidates.sort(
+                key=lambda credential: len(credential.api_root), reverse=True
+            )
+        return dict(index)
+
+    def _get_index(self) -> Dict[str, List[APICredential]]:
+        index = self._index
+        if (
+            index is not None
+            and time.monotonic() - self._loaded < settings.API_CREDENTIAL_INDEX_TIMEOUT
+        ):
+            return index
+
+        with self._lock:
+            if self._index is index:
+                self._index = self._load()
+                self._loaded = time.monotonic()
+            return self._index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+
+    def get(self, url: str) -> Optional[APICredential]:
+        for candidate in self._get_index().get(get_origin(url), []):
+            if url.startswith(candidate.api_root):
+                return candidate
+        return None
+
+
+credential_index = CredentialIndex()
+
+
+def get_client_auth(url: str, **kwargs) -> Optional[ClientAuth]:
+    """
+    Drop-in replacement for ``APICredential.get_auth`` using the index.
+    """
+    credentials = credential_index.get(url)
+    if credentials is None:
+        return None
+
+    # a new ClientAuth per call, so the JWT is generated with a fresh 'iat'
+    return ClientAuth(
+        client_id=credentials.client_id,
+        secret=credentials.secret,
+        user_id=credentials.user_id,
+        user_representation=credentials.user_representation,
+        **kwargs,
+    )
+
+
 def get_auth(url: str) -> dict:
     logger.info("Authenticating for %s", url)
-    auth = APICredential.get_auth(url)
+    auth = get_client_auth(url)
     if auth is None:
         logger.warning("Could not authenticate for %s", url)
         return {}
@@ -0,0 +1,219 @@
+"""
+Cache the responses of the ``retrieve`` and ``list`` operations.
+
+The cached responses are shared between all processes through the
+``RESPONSE_CACHE``. Every resource has a revision in the cache, which is part
+of the keys of its cached responses. Changing or deleting the resource drops
+the revision once the change is committed (see ``signals``), so its cached
+responses are never served again and expire on their own. The responses are
+cached from the primary database, since the replicas may lag behind.
+
+List responses depend on many resources, so they are cached with the
+generations of the models they show instead. Every committed write bumps the
+generation of the model, which outdates all its cached lists at once. An
+outdated list is recomputed (from the primary database) by one process at a
+time, the other processes serve the outdated list in the meantime.
+"""
+import hashlib
+import json
+import time
+import uuid
+from typing import Tuple, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models
+
+from rest_framework.response import Response
+
+from verzoeken.utils.replicas import use_replicas
+
+# seconds before a crashed recomputation of a list no longer blocks others
+LOCK_TIMEOUT = 30
+
+
+def _revision_key(model: Type[models.Model], resource_uuid) -> str:
+    return f"response:{model._meta.label_lower}:{resource_uuid}:revision"
+
+
+def get_revision(model: Type[models.Model], resource_uuid) -> str:
+    cache = caches[settings.RESPONSE_CACHE]
+    key = _revision_key(model, resource_uuid)
+    revision = cache.get(key)
+    if revision is None:
+        cache.add(key, uuid.uuid4().hex, settings.RESPONSE_CACHE_TIMEOUT)
+        revision = cache.get(key)
+    return revision
+
+
+def invalidate_response_cache(model: Type[models.Model], resource_uuid) -> None:
+    """
+    Invalidate all cached responses of the resource.
+    """
+    caches[settings.RESPONSE_CACHE].delete(_revision_key(model, resource_uuid))
+
+
+def _generation_key(model: Type[models.Model]) -> str:
+    return f"response:{model._meta.label_lower}:generation"
+
+
+def get_generations(*models: Type[models.Model]) -> Tuple[int, ...]:
+    cache = caches[settings.RESPONSE_CACHE]
+    keys = [_generation_key(model) for model in models]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # start from the clock, so a flushed cache never revives old lists
+            cache.add(key, int(time.time()), None)
+            generations[key] = cache.get(key, int(time.time()))
+    return tuple(generations[key] for key in keys)
+
+
+def bump_generation(model: Type[models.Model]) -> None:
+    """
+    Outdate all cached lists of the model in O(1).
+    """
+    cache = caches[settings.RESPONSE_CACHE]
+    try:
+        cache.incr(_generation_key(model))
+    except ValueError:
+        cache.set(_generation_key(model), int(time.time()), None)
+
+
+def get_scopes(request) -> list:
+    jwt_auth = getattr(request, "jwt_auth", None)
+    if jwt_auth is None or not hasattr(jwt_auth, "get_context"):
+        return []
+    context = jwt_auth.get_context(None)
+    if context["heeft_alle_autorisaties"]:
+        return ["*"]
+    return context["scopes"]
+
+
+def get_variant(request, *bits) -> str:
+    """
+    Hash everything besides the resource that the response depends on.
+
+    The URLs in the responses are absolute, so the host is included.
+    """
+    variant = json.dumps(
+        [request.version, request.build_absolute_uri("/"), get_scopes(request), *bits]
+    )
+    return hashlib.sha256(variant.encode("utf-8")).hexdigest()
+
+
+def to_plain_data(data):
+    """
+    Strip the serialized data from everything that can't (or shouldn't) be
+    pickled, like the instances behind the ``Hyperlink`` URLs.
+    """
+    if isinstance(data, dict):
+        return {key: to_plain_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [to_plain_data(value) for value in data]
+    if isinstance(data, str):
+        return str(data)
+    return data
+
+
+class CachedRetrieveMixin:
+    """
+    Serve the ``retrieve`` operation from the response cache.
+
+    The responses are cached per resource, API version, host and the set of
+    scopes of the client. Only succesful responses are cached. Enabled with
+    the ``RESPONSE_CACHE_ENABLED`` setting.
+    """
+
+    def get_response_cache_key(self, request) -> str:
+        model = self.queryset.model
+        resource_uuid = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return ":".join(
+            [
+                "response",
+                model._meta.label_lower,
+                str(resource_uuid),
+                get_revision(model, resource_uuid),
+                get_variant(request),
+            ]
+        )
+
+    def use_response_cache(self) -> bool:
+        return settings.RESPONSE_CACHE_ENABLED
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.use_response_cache():
+            return super().retrieve(request, *args, **kwargs)
+
+        cache = caches[settings.RESPONSE_CACHE]
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        # a replica may lag behind, and its data would be cached until the
+        # next change
+        with use_replicas(False):
+            response = super().retrieve(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(
+                key, to_plain_data(response.data), settings.RESPONSE_CACHE_TIMEOUT
+            )
+        return response
+
+
+class CachedListMixin:
+    """
+    Serve the ``list`` operation from the response cache.
+
+    The responses are cached per query, API version, host and the set of
+    scopes of the client, together with the generations of the
+    ``list_cache_models`` (by default the model of the viewset) and the moment
+    they expire. Outdated and expired lists are kept for another
+    ``RESPONSE_CACHE_TIMEOUT`` seconds, to be served while one process
+    recomputes them. Enabled with the ``RESPONSE_CACHE_ENABLED`` setting.
+    """
+
+    list_cache_models = ()
+
+    def use_response_cache(self) -> bool:
+        return settings.RESPONSE_CACHE_ENABLED
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_response_cache():
+            return super().list(request, *args, **kwargs)
+
+        model = self.queryset.model
+        query = sorted(request.query_params.lists())
+        key = f"response:{model._meta.label_lower}:list:{get_variant(request, query)}"
+        generations = get_generations(*(self.list_cache_models or [model]))
+
+        cache = caches[settings.RESPONSE_CACHE]
+        entry = cache.get(key)
+        if (
+            entry is not None
+            and entry["generations"] == generations
+            and entry["expires"] > time.time()
+        ):
+            return Response(entry["data"])
+
+        # single flight: only one process recomputes the list
+        lock_key = f"{key}:lock"
+        if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+            if entry is not None:
+                return Response(entry["data"])
+            return super().list(request, *args, **kwargs)
+
+        try:
+            with use_replicas(False):
+                response = super().list(request, *args, **kwargs)
+            if response.status_code == 200:
+                entry = {
+                    "generations": generations,
+                    "expires": time.time() + settings.RESPONSE_CACHE_TIMEOUT,
+                    "data": to_plain_data(response.data),
+                }
+                cache.set(key, entry, 2 * settings.RESPONSE_CACHE_TIMEOUT)
+            return response
+        finally:
+            cache.delete(lock_key)
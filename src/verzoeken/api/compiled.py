@@ -0,0 +1,187 @@
+"""
+Serialize querysets for the read operations without model instances.
+
+DRF builds a model instance for every row and runs the fields of the
+serializer one by one on it. The ``CompiledSerializer`` compiles the fields of
+a serializer to ``values_list`` lookups and converters once per request:
+the URLs are built from a template, the other fields use their own
+``to_representation``. The output is the same as that of the serializer.
+Serializers with fields that can't be compiled are left to DRF.
+"""
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import models
+
+from rest_framework import serializers
+from rest_framework.relations import HyperlinkedIdentityField, HyperlinkedRelatedField
+
+PLACEHOLDER = "__lookup__"
+
+# a converter builds the value of a field from the row
+Converter = Callable[[tuple], object]
+
+
+class NotCompilable(Exception):
+    pass
+
+
+def get_url_template(field: HyperlinkedRelatedField) -> Tuple[str, str]:
+    """
+    Return the parts of the URL of the field around the lookup value.
+    """
+    url = field.to_representation(SimpleNamespace(**{field.lookup_field: PLACEHOLDER}))
+    if url is None or url.count(PLACEHOLDER) != 1:
+        raise NotCompilable(f"No URL template for {field.field_name}")
+    prefix, suffix = url.split(PLACEHOLDER)
+    return prefix, suffix
+
+
+def check_uuid_field(model: Type[models.Model], field_name: str) -> None:
+    # other values could be quoted differently in the URL
+    try:
+        model_field = model._meta.get_field(field_name)
+    except FieldDoesNotExist as exc:
+        raise NotCompilable(str(exc)) from exc
+    if not isinstance(model_field, models.UUIDField):
+        raise NotCompilable(f"{model.__name__}.{field_name} is not a UUID")
+
+
+def get_model_field(model: Type[models.Model], field: serializers.Field):
+    if len(field.source_attrs) != 1:
+        raise NotCompilable(f"Nested source of {field.field_name}")
+    try:
+        return model._meta.get_field(field.source_attrs[0])
+    except FieldDoesNotExist as exc:
+        raise NotCompilable(str(exc)) from exc
+
+
+def compile_url(prefix: str, suffix: str, index: int) -> Converter:
+    def convert(row):
+        value = row[index]
+        if value is None:
+            return None
+        return f"{prefix}{value}{suffix}"
+
+    return convert
+
+
+def compile_value(to_representation: Callable, index: int) -> Converter:
+    def convert(row):
+        value = row[index]
+        if value is None:
+            return None
+        return to_representation(value)
+
+    return convert
+
+
+def compile_nested(fields: List[Tuple[str, Converter]]) -> Converter:
+    def convert(row):
+        return {name: field_convert(row) for name, field_convert in fields}
+
+    return convert
+
+
+def compile_fields(
+    serializer: serializers.Serializer, model: Type[models.Model], lookups: List[str]
+) -> List[Tuple[str, Converter]]:
+    """
+    Compile the readable fields of the serializer, adding the lookups they
+    need to ``lookups``.
+    """
+    fields = []
+    for field in serializer._readable_fields:
+        if isinstance(field, HyperlinkedIdentityField):
+            check_uuid_field(model, field.lookup_field)
+            lookups.append(field.lookup_field)
+            convert = compile_url(*get_url_template(field), len(lookups) - 1)
+
+        elif isinstance(field, HyperlinkedRelatedField):
+            model_field = get_model_field(model, field)
+            if not model_field.is_relation or model_field.many_to_many:
+                raise NotCompilable(f"{field.field_name} is not a single relation")
+            check_uuid_field(model_field.related_model, field.lookup_field)
+            lookups.append(f"{field.source}__{field.lookup_field}")
+            convert = compile_url(*get_url_template(field), len(lookups) - 1)
+
+        elif isinstance(field, serializers.Serializer) and field.source == "*":
+            convert = compile_nested(compile_fields(field, model, lookups))
+
+        elif (
+            isinstance(
+                field,
+                (
+                    serializers.BaseSerializer,
+                    serializers.RelatedField,
+                    serializers.ManyRelatedField,
+                ),
+            )
+            or field.source == "*"
+        ):
+            raise NotCompilable(f"{field.field_name} can't be compiled")
+
+        else:
+            model_field = get_model_field(model, field)
+            if not model_field.concrete or model_field.is_relation:
+                raise NotCompilable(f"{field.field_name} is not a column")
+            lookups.append(field.source)
+            convert = compile_value(field.to_representation, len(lookups) - 1)
+
+        fields.append((field.field_name, convert))
+    return fields
+
+
+class CompiledSerializer:
+    """
+    Serialize a queryset like ``serializer_class(queryset, many=True)``.
+
+    Raises ``NotCompilable`` if a field of the serializer isn't supported.
+    """
+
+    def __init__(
+        self,
+        serializer_class: Type[serializers.ModelSerializer],
+        queryset: models.QuerySet,
+        context: Optional[dict] = None,
+    ):
+        serializer = serializer_class(context=context or {})
+        self.lookups = []
+        self.fields = compile_fields(serializer, queryset.model, self.lookups)
+
+        try:
+            self.queryset = queryset.prefetch_related(None).values_list(*self.lookups)
+        except FieldError as exc:
+            raise NotCompilable(str(exc)) from exc
+
+    @property
+    def data(self) -> List[dict]:
+        fields = self.fields
+        return [
+            {name: convert(row) for name, convert in fields} for row in self.queryset
+        ]
+
+
+class CompiledListMixin:
+    """
+    Serialize the querysets of the read operations with ``CompiledSerializer``.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        if (
+            kwargs.get("many")
+            and args
+            and isinstance(args[0], models.QuerySet)
+            and self.request.method in ("GET", "HEAD")
+        ):
+            try:
+                return CompiledSerializer(
+                    self.get_serializer_class(),
+                    args[0],
+                    context=self.get_serializer_context(),
+                )
+            except NotCompilable:
+                pass
+
+        return super().get_serializer(*args, **kwargs)
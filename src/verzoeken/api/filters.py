@@ -1,35 +1,182 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import models
+from django.db.models import F
+from django.utils.translation import ugettext_lazy as _
+
 from django_filters import filters
+from django_filters.constants import EMPTY_VALUES
 from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
+from verzoeken.datamodel.constants import KlantRol, ObjectTypes
+from verzoeken.datamodel.fields import url_hash
 from verzoeken.datamodel.models import (
     KlantVerzoek,
     ObjectVerzoek,
+    Verzoek,
     VerzoekContactMoment,
     VerzoekInformatieObject,
     VerzoekProduct,
+    VerzoekStatistiek,
 )
 
 
-class ObjectVerzoekFilter(FilterSet):
+class URLHashFilter(filters.CharFilter):
+    """
+    Exact match on an URL field, looked up through the index on its hash.
+
+    Used when the model has an ``URLHashField`` named ``<field_name>_hash``.
+    """
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        hash_field = f"{self.field_name}_hash"
+        if not any(field.name == hash_field for field in qs.model._meta.fields):
+            return super().filter(qs, value)
+
+        # the URL itself is compared as well, in case of a hash collision
+        lookups = {hash_field: url_hash(value), self.field_name: value}
+        if self.distinct:
+            qs = qs.distinct()
+        return self.get_method(qs)(**lookups)
+
+
+class URLHashFilterSet(FilterSet):
+    FILTER_DEFAULTS = {
+        **FilterSet.FILTER_DEFAULTS,
+        models.URLField: {
+            **FilterSet.FILTER_DEFAULTS[models.URLField],
+            "filter_class": URLHashFilter,
+        },
+    }
+
+
+class VerzoekFilter(FilterSet):
+    zoek = filters.CharFilter(
+        method="filter_zoek",
+        help_text=_(
+            "Zoek op woorden in de `tekst` van het VERZOEK. De resultaten zijn "
+            "gesorteerd op relevantie."
+        ),
+    )
+    klant = filters.CharFilter(
+        method="filter_klant",
+        help_text=_("URL-referentie naar een KLANT van het VERZOEK."),
+    )
+    rol = filters.ChoiceFilter(
+        choices=KlantRol.choices,
+        method="filter_rol",
+        help_text=_(
+            "Rol van de KLANT bij het VERZOEK. In combinatie met `klant` de rol "
+            "van die KLANT."
+        ),
+    )
+
+    object = filters.CharFilter(
+        method="filter_object",
+        help_text=_("URL-referentie naar een OBJECT van het VERZOEK."),
+    )
+    object_type = filters.ChoiceFilter(
+        choices=ObjectTypes.choices,
+        method="filter_object_type",
+        help_text=_(
+            "Het type van een OBJECT van het VERZOEK. In combinatie met `object` "
+            "het type van dat OBJECT."
+        ),
+    )
+    registratiedatum__gte = filters.IsoDateTimeFilter(
+        field_name="registratiedatum",
+        lookup_expr="gte",
+        help_text=_("Alleen de verzoeken geregistreerd vanaf dit moment."),
+    )
+    registratiedatum__lt = filters.IsoDateTimeFilter(
+        field_name="registratiedatum",
+        lookup_expr="lt",
+        help_text=_("Alleen de verzoeken geregistreerd voor dit moment."),
+    )
+
+    class Meta:
+        model = Verzoek
+        fields = (
+            "zoek",
+            "klant",
+            "rol",
+            "object",
+            "object_type",
+            "status",
+            "registratiedatum__gte",
+            "registratiedatum__lt",
+        )
+
+    def filter_klant(self, queryset, name, value):
+        # a single filter call, so the rol applies to the same KlantVerzoek
+        lookups = {
+            "klantverzoek__klant_hash": url_hash(value),
+            "klantverzoek__klant": value,
+        }
+        rol = self.form.cleaned_data.get("rol")
+        if rol:
+            lookups["klantverzoek__rol"] = rol
+        return queryset.filter(**lookups)
+
+    def filter_rol(self, queryset, name, value):
+        if self.form.cleaned_data.get("klant"):
+            # filtered together with the klant
+            return queryset
+        return queryset.filter(
+            pk__in=KlantVerzoek.objects.filter(rol=value).values("verzoek")
+        )
+
+    def filter_object(self, queryset, name, value):
+        # a single filter call, so the object_type applies to the same
+        # ObjectVerzoek
+        lookups = {
+            "objectverzoek__object_hash": url_hash(value),
+            "objectverzoek__object": value,
+        }
+        object_type = self.form.cleaned_data.get("object_type")
+        if object_type:
+            lookups["objectverzoek__object_type"] = object_type
+        return queryset.filter(**lookups)
+
+    def filter_object_type(self, queryset, name, value):
+        if self.form.cleaned_data.get("object"):
+            # filtered together with the object
+            return queryset
+        return queryset.filter(
+            pk__in=ObjectVerzoek.objects.filter(object_type=value).values("verzoek")
+        )
+
+    def filter_zoek(self, queryset, name, value):
+        query = SearchQuery(value, config="dutch")
+        return (
+            queryset.filter(zoek_vector=query)
+            .annotate(rank=SearchRank(F("zoek_vector"), query))
+            .order_by("-rank", "pk")
+        )
+
+
+class ObjectVerzoekFilter(URLHashFilterSet):
     class Meta:
         model = ObjectVerzoek
         fields = ("object", "verzoek")
 
 
-class VerzoekInformatieObjectFilter(FilterSet):
+class VerzoekInformatieObjectFilter(URLHashFilterSet):
     class Meta:
         model = VerzoekInformatieObject
         fields = ("verzoek", "informatieobject")
 
 
-class VerzoekContactMomentFilter(FilterSet):
+class VerzoekContactMomentFilter(URLHashFilterSet):
     class Meta:
         model = VerzoekContactMoment
         fields = ("verzoek", "contactmoment")
 
 
-class VerzoekProductFilter(FilterSet):
+class VerzoekProductFilter(URLHashFilterSet):
     product_identificatie__code = filters.CharFilter(
         field_name="product_code",
         help_text=get_help_text("datamodel.VerzoekProduct", "product_code"),
@@ -40,7 +187,30 @@ class VerzoekProductFilter(FilterSet):
         fields = ("verzoek", "product", "product_identificatie__code")
 
 
-class KlantVerzoekFilter(FilterSet):
+class KlantVerzoekFilter(URLHashFilterSet):
     class Meta:
         model = KlantVerzoek
         fields = ("verzoek", "klant")
+
+
+class VerzoekStatistiekFilter(FilterSet):
+    week__gte = filters.DateFilter(
+        field_name="week",
+        lookup_expr="gte",
+        help_text=_("Alleen de weken vanaf deze datum."),
+    )
+    week__lte = filters.DateFilter(
+        field_name="week",
+        lookup_expr="lte",
+        help_text=_("Alleen de weken tot en met deze datum."),
+    )
+
+    class Meta:
+        model = VerzoekStatistiek
+        fields = (
+            "bronorganisatie",
+            "status",
+            "voorkeurskanaal",
+            "week__gte",
+            "week__lte",
+        )
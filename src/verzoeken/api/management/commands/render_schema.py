@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...views import write_schema_files
+
+
+class Command(BaseCommand):
+    help = "Render the OpenAPI schema served by the schema endpoints to SCHEMA_ROOT."
+
+    def handle(self, **options):
+        for path in write_schema_files(settings.SCHEMA_ROOT):
+            self.stdout.write(f"Wrote {path}")
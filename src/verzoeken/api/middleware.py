@@ -0,0 +1,120 @@
+import hashlib
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from vng_api_common.authorizations.models import AuthorizationsConfig, Autorisatie
+from vng_api_common.middleware import AuthMiddleware, JWTAuth
+
+GENERATION_KEY = "auth:generation"
+
+
+def get_generation() -> int:
+    cache = caches[settings.AUTH_CACHE]
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # start from the clock, so a flushed cache never revives old entries
+        cache.add(GENERATION_KEY, int(time.time()), None)
+        generation = cache.get(GENERATION_KEY, int(time.time()))
+    return generation
+
+
+def invalidate_auth_cache() -> None:
+    """
+    Invalidate all cached authorization contexts in O(1).
+    """
+    cache = caches[settings.AUTH_CACHE]
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, int(time.time()), None)
+
+
+class CachedJWTAuth(JWTAuth):
+    """
+    Cache the verified JWT payload and the resolved scopes of the client.
+
+    The payload is cached per token hash (no longer than the token is valid),
+    the authorization context (all scopes of the client for the component) per
+    client ID. Only the scope checks without extra fields, as done by
+    ``AuthScopesRequired``, use the cached context.
+    """
+
+    def _cache_key(self, *bits) -> str:
+        if not hasattr(self, "_generation"):
+            self._generation = get_generation()
+        return ":".join(["auth", str(self._generation), *bits])
+
+    @property
+    def payload(self):
+        if self.encoded is None:
+            return None
+
+        if not hasattr(self, "_payload"):
+            cache = caches[settings.AUTH_CACHE]
+            token_hash = hashlib.sha256(self.encoded.encode("utf-8")).hexdigest()
+            key = self._cache_key("payload", token_hash)
+
+            payload = cache.get(key)
+            # PyJWT only checks the expiry when decoding
+            if payload is None or payload.get("exp", float("inf")) < time.time():
+                # raises PermissionDenied for invalid tokens, which are not cached
+                payload = super().payload
+                timeout = settings.AUTH_CACHE_TIMEOUT
+                if "exp" in payload:
+                    timeout = min(timeout, int(payload["exp"] - time.time()))
+                if timeout > 0:
+                    cache.set(key, payload, timeout)
+            self._payload = payload
+
+        return self._payload
+
+    def get_context(self, component: Optional[str]) -> dict:
+        cache = caches[settings.AUTH_CACHE]
+        key = self._cache_key("context", self.client_id, component or "")
+
+        context = cache.get(key)
+        if context is not None:
+            return context
+
+        applicaties = list(self.applicaties)
+        if component is None:
+            component = AuthorizationsConfig.get_solo().component
+
+        scopes = set()
+        autorisaties = Autorisatie.objects.filter(
+            applicatie__in=applicaties, component=component
+        )
+        for autorisatie_scopes in autorisaties.values_list("scopes", flat=True):
+            scopes.update(autorisatie_scopes)
+
+        context = {
+            "heeft_alle_autorisaties": any(
+                applicatie.heeft_alle_autorisaties for applicatie in applicaties
+            ),
+            "scopes": sorted(scopes),
+        }
+        # unknown clients are looked up in the AC again on the next request
+        if applicaties:
+            cache.set(key, context, settings.AUTH_CACHE_TIMEOUT)
+        return context
+
+    def has_auth(self, scopes, component: Optional[str] = None, **fields) -> bool:
+        if scopes is None:
+            return False
+
+        if fields or self.client_id is None:
+            return super().has_auth(scopes, component=component, **fields)
+
+        context = self.get_context(component)
+        if context["heeft_alle_autorisaties"]:
+            return True
+        return scopes.is_contained_in(context["scopes"])
+
+
+class CachedAuthMiddleware(AuthMiddleware):
+    def extract_jwt_payload(self, request):
+        super().extract_jwt_payload(request)
+        request.jwt_auth = CachedJWTAuth(request.jwt_auth.encoded)
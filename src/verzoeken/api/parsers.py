@@ -0,0 +1,62 @@
+"""
+Parse the JSON request bodies with camelCase keys.
+
+The counterpart of ``verzoeken.api.renderers``: gives the same result as the
+parser of djangorestframework-camel-case, but converts every key only once
+per process and decodes the JSON with orjson if it's installed.
+"""
+import json
+from functools import lru_cache
+
+from django.conf import settings
+
+from djangorestframework_camel_case import parser
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework.exceptions import ParseError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+@lru_cache(maxsize=1024)
+def underscore_key(key: str) -> str:
+    return camel_to_underscore(key, **api_settings.JSON_UNDERSCOREIZE)
+
+
+def underscoreize(data):
+    """
+    Convert the keys of decoded JSON like
+    ``djangorestframework_camel_case.util.underscoreize``.
+    """
+    if isinstance(data, dict):
+        return {
+            underscore_key(key): underscoreize(value) for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [underscoreize(item) for item in data]
+    return data
+
+
+def loads(content: bytes, encoding: str):
+    if orjson is not None and encoding.lower() in ("utf-8", "utf8"):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # the json module is more lenient (e.g. NaN) and reports the error
+            pass
+    return json.loads(content.decode(encoding))
+
+
+class CamelCaseJSONParser(parser.CamelCaseJSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = loads(stream.read(), encoding)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+        return underscoreize(data)
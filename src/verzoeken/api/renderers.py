@@ -0,0 +1,143 @@
+"""
+Render the API responses with camelCase keys.
+
+Produces the same output as the renderer of djangorestframework-camel-case,
+but converts every key only once: the keys of the serializer of the view are
+converted up front, other keys are converted once per process. The JSON is
+encoded with orjson if it's installed, otherwise with the ``json`` module.
+Data that orjson encodes differently (like NaN) is left to the ``json``
+module.
+"""
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Type
+
+from django.utils.encoding import force_text
+from django.utils.functional import Promise
+
+from djangorestframework_camel_case import render
+from djangorestframework_camel_case.util import (
+    camelize_re,
+    is_iterable,
+    underscore_to_camel,
+)
+from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+@lru_cache(maxsize=1024)
+def camelize_key(key: str) -> str:
+    if "_" not in key:
+        return key
+    return re.sub(camelize_re, underscore_to_camel, key)
+
+
+@lru_cache(maxsize=None)
+def get_key_map(serializer_class: Optional[Type[BaseSerializer]]) -> Dict[str, str]:
+    """
+    Map the snake_case names of the (nested) fields of the serializer to
+    camelCase.
+    """
+    key_map = {}
+
+    def add_fields(serializer: Serializer):
+        for name, field in serializer.fields.items():
+            key_map[name] = camelize_key(name)
+            if isinstance(field, ListSerializer):
+                field = field.child
+            if isinstance(field, Serializer):
+                add_fields(field)
+
+    if serializer_class is not None and issubclass(serializer_class, Serializer):
+        add_fields(serializer_class())
+    return key_map
+
+
+def camelize(data, key_map: Dict[str, str]):
+    """
+    Convert the keys like ``djangorestframework_camel_case.util.camelize``.
+    """
+    if isinstance(data, dict):
+        new_dict = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_text(key)
+            if isinstance(key, str):
+                new_key = key_map.get(key)
+                if new_key is None:
+                    new_key = camelize_key(key)
+            else:
+                new_key = key
+            new_dict[new_key] = camelize(value, key_map)
+        return new_dict
+    if isinstance(data, str):
+        return data
+    if isinstance(data, list):
+        return [camelize(item, key_map) for item in data]
+    if isinstance(data, Promise):
+        return force_text(data)
+    if is_iterable(data):
+        return [camelize(item, key_map) for item in data]
+    return data
+
+
+def is_finite(data) -> bool:
+    """
+    Check that the camelized data contains no NaN or infinite floats, which
+    orjson renders as ``null``.
+    """
+    if isinstance(data, dict):
+        return all(is_finite(value) for value in data.values())
+    if isinstance(data, list):
+        return all(is_finite(item) for item in data)
+    if isinstance(data, float):
+        return math.isfinite(data)
+    return True
+
+
+class CamelCaseJSONRenderer(render.CamelCaseJSONRenderer):
+    def render_json(self, data, accepted_media_type, renderer_context) -> bytes:
+        # skip the camelize of djangorestframework-camel-case
+        return super(render.CamelCaseJSONRenderer, self).render(
+            data, accepted_media_type, renderer_context
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+
+        renderer_context = renderer_context or {}
+        view = renderer_context.get("view")
+        key_map = get_key_map(getattr(view, "serializer_class", None))
+        data = camelize(data, key_map)
+
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+            # rejected (or rendered as NaN) by the json module
+            or not is_finite(data)
+        ):
+            return self.render_json(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            # e.g. integers of more than 64 bits, left to the json module
+            return self.render_json(data, accepted_media_type, renderer_context)
+
+        # escaped like the JSONRenderer does, for use in JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -28,6 +28,7 @@ from verzoeken.datamodel.models import (
     VerzoekContactMoment,
     VerzoekInformatieObject,
     VerzoekProduct,
+    VerzoekStatistiek,
 )
 from verzoeken.sync.signals import SyncError
 
@@ -36,6 +37,12 @@ from .validators import ObjectVerzoekCreateValidator
 logger = logging.getLogger(__name__)
 
 
+def get_choices_help_text(model_string: str, field_name: str, choices) -> str:
+    # computed once, instead of in the __init__ of every serializer
+    help_text = get_help_text(model_string, field_name)
+    return f"{help_text}\n\n{add_choice_values_help_text(choices)}"
+
+
 class VerzoekSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Verzoek
@@ -60,16 +67,15 @@ class VerzoekSerializer(serializers.HyperlinkedModelSerializer):
             "intrekkende_verzoek": {"lookup_field": "uuid", "read_only": True,},
             "aangevulde_verzoek": {"lookup_field": "uuid"},
             "aanvullende_verzoek": {"lookup_field": "uuid", "read_only": True,},
+            "status": {
+                "help_text": get_choices_help_text(
+                    "datamodel.Verzoek", "status", VerzoekStatus
+                )
+            },
         }
         # Replace a default "unique together" constraint.
         validators = [UniekeIdentificatieValidator("bronorganisatie", "identificatie")]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(VerzoekStatus)
-        self.fields["status"].help_text += f"\n\n{value_display_mapping}"
-
 
 class ObjectVerzoekSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
@@ -82,19 +88,15 @@ class ObjectVerzoekSerializer(serializers.HyperlinkedModelSerializer):
                 "validators": [IsImmutableValidator()],
             },
             "object": {"validators": [IsImmutableValidator()],},
-            "object_type": {"validators": [IsImmutableValidator()]},
+            "object_type": {
+                "validators": [IsImmutableValidator()],
+                "help_text": get_choices_help_text(
+                    "datamodel.ObjectVerzoek", "object_type", ObjectTypes
+                ),
+            },
         }
         validators = [ObjectVerzoekCreateValidator()]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(ObjectTypes)
-        self.fields["object_type"].help_text += f"\n\n{value_display_mapping}"
-
-        if not hasattr(self, "initial_data"):
-            return
-
 
 class VerzoekInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
@@ -213,17 +215,23 @@ class KlantVerzoekSerializer(serializers.HyperlinkedModelSerializer):
             "url": {"lookup_field": "uuid"},
             "verzoek": {"lookup_field": "uuid", "validators": [IsImmutableValidator()]},
             "klant": {"validators": [IsImmutableValidator()]},
+            "rol": {
+                "help_text": get_choices_help_text(
+                    "datamodel.KlantVerzoek", "rol", KlantRol
+                )
+            },
+            "indicatie_machtiging": {
+                "help_text": get_choices_help_text(
+                    "datamodel.KlantVerzoek",
+                    "indicatie_machtiging",
+                    IndicatieMachtiging,
+                )
+            },
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
-        rol_machtiging_display_mapping = add_choice_values_help_text(KlantRol)
-        self.fields["rol"].help_text += f"\n\n{rol_machtiging_display_mapping}"
-
-        indicatie_machtiging_display_mapping = add_choice_values_help_text(
-            IndicatieMachtiging
-        )
-        self.fields[
-            "indicatie_machtiging"
-        ].help_text += f"\n\n{indicatie_machtiging_display_mapping}"
+class VerzoekStatistiekSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = VerzoekStatistiek
+        fields = ("week", "bronorganisatie", "status", "voorkeurskanaal", "aantal")
+        read_only_fields = fields
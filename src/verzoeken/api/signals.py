@@ -0,0 +1,108 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import (
+    Applicatie,
+    AuthorizationsConfig,
+    Autorisatie,
+)
+from vng_api_common.models import APICredential, JWTSecret
+
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+
+from .auth import credential_index
+from .caching import bump_generation, invalidate_response_cache
+from .middleware import invalidate_auth_cache
+
+
+@receiver([post_save, post_delete], sender=Applicatie)
+@receiver([post_save, post_delete], sender=Autorisatie)
+@receiver([post_save, post_delete], sender=AuthorizationsConfig)
+@receiver([post_save, post_delete], sender=JWTSecret)
+def invalidate_authorizations(sender, **kwargs):
+    # covers the updates made by the notifications of the Autorisaties API
+    invalidate_auth_cache()
+
+
+@receiver([post_save, post_delete], sender=APICredential)
+def invalidate_credential_index(sender, **kwargs):
+    credential_index.invalidate()
+
+
+RELATION_MODELS = [
+    KlantVerzoek,
+    ObjectVerzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+]
+
+
+def invalidate_on_commit(model, resource_uuid) -> None:
+    # invalidated before the commit, a request in between would cache the old
+    # data again
+    transaction.on_commit(partial(invalidate_response_cache, model, resource_uuid))
+
+
+def bump_generation_on_commit(model) -> None:
+    transaction.on_commit(partial(bump_generation, model))
+
+
+@receiver(pre_save, sender=Verzoek)
+def invalidate_previous_chain(sender, instance: Verzoek, raw=False, **kwargs):
+    # the previously withdrawn or supplemented verzoeken show this verzoek
+    if not settings.RESPONSE_CACHE_ENABLED or raw or instance.pk is None:
+        return
+    previous = Verzoek.objects.filter(pk=instance.pk).values_list(
+        "in_te_trekken_verzoek__uuid", "aangevulde_verzoek__uuid"
+    )
+    for uuids in previous:
+        for verzoek_uuid in uuids:
+            if verzoek_uuid:
+                invalidate_on_commit(Verzoek, verzoek_uuid)
+
+
+@receiver([post_save, pre_delete, post_delete], sender=Verzoek)
+def invalidate_verzoek(sender, instance: Verzoek, **kwargs):
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+
+    bump_generation_on_commit(Verzoek)
+    invalidate_on_commit(Verzoek, instance.uuid)
+    for verzoek in [instance.in_te_trekken_verzoek, instance.aangevulde_verzoek]:
+        if verzoek is not None:
+            invalidate_on_commit(Verzoek, verzoek.uuid)
+
+    # the database deletes the relations without signals
+    if kwargs["signal"] is pre_delete:
+        for model in RELATION_MODELS:
+            bump_generation_on_commit(model)
+            for uuid in model.objects.filter(verzoek=instance).values_list(
+                "uuid", flat=True
+            ):
+                invalidate_on_commit(model, uuid)
+
+
+@receiver([post_save, pre_delete, post_delete], sender=KlantVerzoek)
+@receiver([post_save, pre_delete, post_delete], sender=ObjectVerzoek)
+@receiver([post_save, pre_delete, post_delete], sender=VerzoekContactMoment)
+@receiver([post_save, pre_delete, post_delete], sender=VerzoekInformatieObject)
+@receiver([post_save, pre_delete, post_delete], sender=VerzoekProduct)
+def invalidate_relation(sender, instance, **kwargs):
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+
+    bump_generation_on_commit(sender)
+    invalidate_on_commit(sender, instance.uuid)
+    invalidate_on_commit(Verzoek, instance.verzoek.uuid)
@@ -1,11 +1,33 @@
 """
 Guarantee that the proper authorization machinery is in place.
 """
+import time
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+import jwt
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.test import APITestCase
-from vng_api_common.tests import AuthCheckMixin, reverse
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.models import APICredential, JWTSecret
+from vng_api_common.tests import (
+    AuthCheckMixin,
+    JWTAuthMixin,
+    generate_jwt_auth,
+    reverse,
+)
 
 from verzoeken.datamodel.tests.factories import VerzoekFactory
 
+from ..auth import credential_index, get_auth, get_client_auth
+from ..middleware import CachedJWTAuth
+from ..scopes import SCOPE_VERZOEKEN_AANMAKEN, SCOPE_VERZOEKEN_ALLES_LEZEN
+
 
 class KlantScopeForbiddenTests(AuthCheckMixin, APITestCase):
     def test_cannot_create_klant_without_correct_scope(self):
@@ -22,3 +44,138 @@ class KlantScopeForbiddenTests(AuthCheckMixin, APITestCase):
         for url in urls:
             with self.subTest(url=url):
                 self.assertForbidden(url, method="get")
+
+
+class CachedJWTAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [str(SCOPE_VERZOEKEN_ALLES_LEZEN)]
+
+    def setUp(self):
+        super().setUp()
+        self.token = generate_jwt_auth(self.client_id, self.secret).split(" ")[1]
+
+    def test_authorizations_are_cached(self):
+        self.assertTrue(CachedJWTAuth(self.token).has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN))
+
+        with self.assertNumQueries(0):
+            jwt_auth = CachedJWTAuth(self.token)
+            self.assertTrue(jwt_auth.has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN))
+            self.assertFalse(jwt_auth.has_auth(SCOPE_VERZOEKEN_AANMAKEN))
+
+    def test_cache_invalidated_on_autorisatie_change(self):
+        self.assertTrue(CachedJWTAuth(self.token).has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN))
+
+        self.autorisatie.scopes = [str(SCOPE_VERZOEKEN_AANMAKEN)]
+        self.autorisatie.save()
+
+        jwt_auth = CachedJWTAuth(self.token)
+        self.assertFalse(jwt_auth.has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN))
+        self.assertTrue(jwt_auth.has_auth(SCOPE_VERZOEKEN_AANMAKEN))
+
+    def test_cache_invalidated_on_secret_change(self):
+        self.assertEqual(CachedJWTAuth(self.token).client_id, self.client_id)
+
+        JWTSecret.objects.filter(identifier=self.client_id).get().delete()
+
+        with self.assertRaises(PermissionDenied):
+            CachedJWTAuth(self.token).payload
+
+    @patch("vng_api_common.middleware.JWTAuth._request_auth", return_value=[])
+    def test_cache_invalidated_by_autorisaties_notification(self, mock_request):
+        Autorisatie.objects.create(
+            applicatie=self.applicatie,
+            component=self.autorisatie.component,
+            scopes=["notificaties.publiceren"],
+        )
+        self.assertTrue(CachedJWTAuth(self.token).has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN))
+        applicatie_url = (
+            f"https://autorisaties.nl/api/v1/applicaties/{self.applicatie.uuid}"
+        )
+
+        response = self.client.post(
+            reverse("notificaties-webhook"),
+            {
+                "kanaal": "autorisaties",
+                "hoofdObject": applicatie_url,
+                "resource": "applicatie",
+                "resourceUrl": applicatie_url,
+                "actie": "delete",
+                "aanmaakdatum": "2020-01-01T00:00:00Z",
+                "kenmerken": {},
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(
+            CachedJWTAuth(self.token).has_auth(SCOPE_VERZOEKEN_ALLES_LEZEN)
+        )
+
+    def test_expired_token_not_served_from_cache(self):
+        with freeze_time("2020-01-01T12:00:00Z"):
+            token = jwt.encode(
+                {"client_id": self.client_id, "exp": int(time.time()) + 60},
+                self.secret,
+                algorithm="HS256",
+            ).decode("ascii")
+            self.assertEqual(CachedJWTAuth(token).client_id, self.client_id)
+
+        with freeze_time("2020-01-01T12:00:30Z"):
+            with self.assertNumQueries(0):
+                self.assertEqual(CachedJWTAuth(token).client_id, self.client_id)
+
+        with freeze_time("2020-01-01T12:01:01Z"):
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                CachedJWTAuth(token).payload
+
+    def test_request_uses_cache(self):
+        url = reverse("verzoek-list")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # only the actual list query remains
+        self.assertEqual(len(queries), 1, [query["sql"] for query in queries])
+
+
+class CredentialIndexTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        credential_index.invalidate()
+        self.addCleanup(credential_index.invalidate)
+
+        APICredential.objects.create(
+            api_root="https://example.com/", client_id="short", secret="secret"
+        )
+        APICredential.objects.create(
+            api_root="https://example.com/api/v1/", client_id="long", secret="secret",
+        )
+
+    def test_longest_api_root_wins(self):
+        self.assertEqual(
+            get_client_auth("https://example.com/api/v1/zaken/1").client_id, "long"
+        )
+        self.assertEqual(
+            get_client_auth("https://example.com/other/1").client_id, "short"
+        )
+        self.assertIsNone(get_client_auth("https://example.com.evil/api/v1/zaken"))
+
+    def test_lookup_without_queries(self):
+        get_client_auth("https://example.com/api/v1/zaken/1")
+
+        with self.assertNumQueries(0):
+            auth = get_auth("https://example.com/api/v1/zaken/1")
+
+        self.assertIn("Authorization", auth)
+
+    def test_index_refreshed_on_change(self):
+        self.assertIsNone(get_client_auth("https://other.com/api/v1/zaken/1"))
+
+        APICredential.objects.create(
+            api_root="https://other.com/api/v1/", client_id="other", secret="secret"
+        )
+
+        self.assertEqual(
+            get_client_auth("https://other.com/api/v1/zaken/1").client_id, "other"
+        )
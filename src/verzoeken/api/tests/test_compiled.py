@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.versioning import URLPathVersioning
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+)
+from verzoeken.tests.mixins import VerzoekInformatieObjectSyncMixin
+
+from ..compiled import CompiledSerializer, NotCompilable
+from ..serializers import (
+    KlantVerzoekSerializer,
+    ObjectVerzoekSerializer,
+    VerzoekContactMomentSerializer,
+    VerzoekInformatieObjectSerializer,
+    VerzoekProductSerializer,
+    VerzoekSerializer,
+)
+
+
+class CompiledSerializerTests(VerzoekInformatieObjectSyncMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        request = Request(APIRequestFactory().get("/api/v1/verzoeken"))
+        request.version = "1"
+        request.versioning_scheme = URLPathVersioning()
+        self.context = {"request": request, "format": None}
+
+    def test_identical_to_serializer(self):
+        verzoek = VerzoekFactory.create()
+        VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        VerzoekFactory.create(aangevulde_verzoek=verzoek, status="")
+        KlantVerzoekFactory.create(verzoek=verzoek)
+        ObjectVerzoekFactory.create(verzoek=verzoek)
+        VerzoekInformatieObjectFactory.create(verzoek=verzoek)
+        VerzoekContactMomentFactory.create(verzoek=verzoek)
+        VerzoekProductFactory.create(verzoek=verzoek, product="")
+        VerzoekProductFactory.create(verzoek=verzoek, product_code="")
+
+        for serializer_class, model in [
+            (VerzoekSerializer, Verzoek),
+            (KlantVerzoekSerializer, KlantVerzoek),
+            (ObjectVerzoekSerializer, ObjectVerzoek),
+            (VerzoekInformatieObjectSerializer, VerzoekInformatieObject),
+            (VerzoekContactMomentSerializer, VerzoekContactMoment),
+            (VerzoekProductSerializer, VerzoekProduct),
+        ]:
+            with self.subTest(serializer_class=serializer_class):
+                queryset = model.objects.order_by("pk")
+
+                data = CompiledSerializer(
+                    serializer_class, queryset, context=self.context
+                ).data
+
+                expected = serializer_class(
+                    queryset, many=True, context=self.context
+                ).data
+                self.assertGreater(len(data), 0)
+                self.assertEqual(data, expected)
+
+    def test_not_compilable(self):
+        class TekstSerializer(serializers.HyperlinkedModelSerializer):
+            tekst = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Verzoek
+                fields = ("tekst",)
+
+        with self.assertRaises(NotCompilable):
+            CompiledSerializer(
+                TekstSerializer, Verzoek.objects.all(), context=self.context
+            )
+
+
+class CompiledListTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_keten(self):
+        verzoek = VerzoekFactory.create()
+        VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        url = reverse("verzoek-keten", kwargs={"uuid": verzoek.uuid})
+
+        response = self.client.get(url)
+
+        with patch(
+            "verzoeken.api.compiled.CompiledSerializer", side_effect=NotCompilable
+        ):
+            expected = self.client.get(url).json()
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(response.json(), expected)
@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, reverse
@@ -46,6 +49,22 @@ class KlantVerzoekTests(JWTAuthMixin, APITestCase):
         data = response.json()
         self.assertEqual(len(data), 1)
 
+    def test_list_filter_klant(self):
+        list_url = reverse(KlantVerzoek)
+        klantverzoek = KlantVerzoekFactory.create(klant=KLANT)
+        KlantVerzoekFactory.create()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(list_url, {"klant": KLANT})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(klantverzoek)}")
+        self.assertTrue(
+            any('"klant_hash" =' in query["sql"] for query in context.captured_queries)
+        )
+
     def test_read_klantverzoek(self):
         klantverzoek = KlantVerzoekFactory.create()
         verzoek_url = reverse(klantverzoek.verzoek)
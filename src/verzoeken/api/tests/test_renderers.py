@@ -0,0 +1,126 @@
+import io
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.utils.timezone import make_aware
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as LibraryCamelCaseJSONParser,
+)
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.tests.factories import VerzoekFactory
+
+from ..parsers import CamelCaseJSONParser
+from ..renderers import CamelCaseJSONRenderer, orjson
+from ..viewsets import VerzoekViewSet
+
+
+class CamelCaseJSONRendererTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        verzoek = VerzoekFactory.create(tekst="regel\u2028regel ü")
+        self.data = {
+            "verzoek": self.client.get(reverse(verzoek)).data,
+            "extra_data": [
+                make_aware(datetime(2020, 1, 1, 12, 0, 0, 123456)),
+                Decimal("1.5"),
+                uuid.UUID(int=1),
+                _("lazy_text"),
+                {_("lazy_key"): ("nested_tuple", {"snake_case_2": None})},
+            ],
+        }
+        self.renderer_context = {"view": VerzoekViewSet()}
+
+    def assertRenderedIdentical(self):
+        for accepted_media_type in ("application/json", "application/json; indent=4"):
+            with self.subTest(accepted_media_type=accepted_media_type):
+                rendered = CamelCaseJSONRenderer().render(
+                    self.data, accepted_media_type, self.renderer_context
+                )
+                expected = LibraryCamelCaseJSONRenderer().render(
+                    self.data, accepted_media_type, self.renderer_context
+                )
+
+                self.assertEqual(rendered, expected)
+
+    def test_render_identical(self):
+        self.assertRenderedIdentical()
+
+    def test_render_identical_without_orjson(self):
+        with patch("verzoeken.api.renderers.orjson", None):
+            self.assertRenderedIdentical()
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_render_with_orjson(self):
+        with patch(
+            "verzoeken.api.renderers.orjson.dumps", wraps=orjson.dumps
+        ) as mock_dumps:
+            self.assertRenderedIdentical()
+
+        mock_dumps.assert_called_once()
+
+    def test_render_not_finite(self):
+        for value in (float("nan"), float("inf"), -float("inf")):
+            self.data = {"nested": [{"float_value": value}]}
+            for renderer in (CamelCaseJSONRenderer(), LibraryCamelCaseJSONRenderer()):
+                with self.subTest(value=value, renderer=renderer):
+                    with self.assertRaises(ValueError):
+                        renderer.render(self.data, "application/json")
+
+    def test_render_big_integer(self):
+        self.data = {"big_integer": 2 ** 70}
+
+        self.assertRenderedIdentical()
+
+    def test_render_none(self):
+        self.assertEqual(CamelCaseJSONRenderer().render(None), b"")
+
+
+class CamelCaseJSONParserTests(APITestCase):
+    content = (
+        '{"inTeTrekkenVerzoek": null, "objectType": "zaak", "tekst": "ü",'
+        ' "nested": [{"keyWith2Numbers": 1.5, "aBC": NaN}]}'
+    ).encode("utf-8")
+
+    def test_parse_identical(self):
+        parsed = CamelCaseJSONParser().parse(io.BytesIO(self.content))
+
+        expected = LibraryCamelCaseJSONParser().parse(io.BytesIO(self.content))
+        self.assertEqual(repr(parsed), repr(expected))
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_parse_with_orjson(self):
+        content = b'{"objectType": "zaak", "nested": [{"keyWith2Numbers": 1.5}]}'
+
+        with patch(
+            "verzoeken.api.parsers.orjson.loads", wraps=orjson.loads
+        ) as mock_loads:
+            parsed = CamelCaseJSONParser().parse(io.BytesIO(content))
+
+        mock_loads.assert_called_once()
+        expected = LibraryCamelCaseJSONParser().parse(io.BytesIO(content))
+        self.assertEqual(repr(parsed), repr(expected))
+
+    def test_parse_identical_without_orjson(self):
+        with patch("verzoeken.api.parsers.orjson", None):
+            parsed = CamelCaseJSONParser().parse(io.BytesIO(self.content))
+
+        expected = LibraryCamelCaseJSONParser().parse(io.BytesIO(self.content))
+        self.assertEqual(repr(parsed), repr(expected))
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseError):
+            CamelCaseJSONParser().parse(io.BytesIO(b'{"tekst": '))
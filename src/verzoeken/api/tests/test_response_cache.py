@@ -0,0 +1,237 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.api.caching import bump_generation
+from verzoeken.api.viewsets import VerzoekViewSet
+from verzoeken.datamodel.models import KlantVerzoek, ObjectVerzoek, Verzoek
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekFactory,
+)
+from verzoeken.utils.replicas import ReplicaRouter
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        caches["responses"].clear()
+        self.addCleanup(caches["responses"].clear)
+
+    def run_commit_hooks(self):
+        # the test case is never committed, run the callbacks waiting for it
+        while connection.run_on_commit:
+            _, callback = connection.run_on_commit.pop(0)
+            callback()
+
+    def test_retrieve_from_cache(self):
+        verzoek = VerzoekFactory.create(tekst="oud")
+        detail_url = reverse(verzoek)
+        self.client.get(detail_url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["tekst"], "oud")
+        self.assertFalse(
+            any('"datamodel_verzoek"' in query["sql"] for query in context)
+        )
+
+    def test_invalidate_on_save(self):
+        verzoek = VerzoekFactory.create(tekst="oud")
+        detail_url = reverse(verzoek)
+        self.client.get(detail_url)
+
+        verzoek.tekst = "nieuw"
+        verzoek.save()
+        self.run_commit_hooks()
+        response = self.client.get(detail_url)
+
+        self.assertEqual(response.json()["tekst"], "nieuw")
+
+    def test_invalidate_after_commit(self):
+        verzoek = VerzoekFactory.create(tekst="oud")
+        detail_url = reverse(verzoek)
+        self.client.get(detail_url)
+
+        with transaction.atomic():
+            verzoek.tekst = "nieuw"
+            verzoek.save()
+
+            # other connections don't see the change yet
+            self.assertEqual(self.client.get(detail_url).json()["tekst"], "oud")
+
+        self.run_commit_hooks()
+        response = self.client.get(detail_url)
+
+        self.assertEqual(response.json()["tekst"], "nieuw")
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_cached_from_primary(self):
+        verzoek = VerzoekFactory.create()
+        databases = []
+
+        def get_object(viewset):
+            databases.append(ReplicaRouter().db_for_read(Verzoek))
+            return verzoek
+
+        with patch.object(VerzoekViewSet, "get_object", get_object):
+            response = self.client.get(reverse(verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # a replica may lag behind
+        self.assertEqual(databases, [None])
+
+    def test_invalidate_chained_verzoek(self):
+        verzoek = VerzoekFactory.create()
+        detail_url = reverse(verzoek)
+        self.client.get(detail_url)
+
+        intrekkende_verzoek = VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        self.run_commit_hooks()
+        response = self.client.get(detail_url)
+
+        self.assertEqual(
+            response.json()["intrekkendeVerzoek"],
+            f"http://testserver{reverse(intrekkende_verzoek)}",
+        )
+
+        intrekkende_verzoek.in_te_trekken_verzoek = None
+        intrekkende_verzoek.save()
+        self.run_commit_hooks()
+        response = self.client.get(detail_url)
+
+        self.assertIsNone(response.json()["intrekkendeVerzoek"])
+
+    def test_invalidate_cascaded_relation(self):
+        objectverzoek = ObjectVerzoekFactory.create()
+        detail_url = reverse(objectverzoek)
+        self.client.get(detail_url)
+
+        self.client.delete(reverse(objectverzoek.verzoek))
+        self.run_commit_hooks()
+        response = self.client.get(detail_url)
+
+        self.assertFalse(ObjectVerzoek.objects.exists())
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_not_found_not_cached(self):
+        verzoek = VerzoekFactory.create()
+        detail_url = reverse(verzoek)
+        Verzoek.objects.filter(pk=verzoek.pk).delete()
+
+        response = self.client.get(detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        cached_keys = [
+            key
+            for key in caches["responses"]._cache
+            if ":response:" in key and not key.endswith((":revision", ":generation"))
+        ]
+        self.assertEqual(cached_keys, [])
+
+    def test_list_from_cache(self):
+        VerzoekFactory.create_batch(2)
+        list_url = reverse(Verzoek)
+        self.client.get(list_url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(list_url)
+
+        self.assertEqual(len(response.json()), 2)
+        self.assertFalse(
+            any('"datamodel_verzoek"' in query["sql"] for query in context)
+        )
+
+    def test_list_outdated_by_write(self):
+        klant = "http://some.klanten.nl/api/v1/klanten/1"
+        KlantVerzoekFactory.create(klant=klant)
+        self.client.get(reverse(KlantVerzoek), {"klant": klant})
+        self.client.get(reverse(Verzoek), {"klant": klant})
+
+        KlantVerzoekFactory.create(klant=klant)
+        self.run_commit_hooks()
+
+        response = self.client.get(reverse(KlantVerzoek), {"klant": klant})
+        self.assertEqual(len(response.json()), 2)
+        # the verzoeken can be filtered on their klanten
+        response = self.client.get(reverse(Verzoek), {"klant": klant})
+        self.assertEqual(len(response.json()), 2)
+
+    def test_list_outdated_after_commit(self):
+        VerzoekFactory.create()
+        list_url = reverse(Verzoek)
+        self.client.get(list_url)
+
+        with transaction.atomic():
+            VerzoekFactory.create()
+
+            self.assertEqual(len(self.client.get(list_url).json()), 1)
+
+        self.run_commit_hooks()
+        response = self.client.get(list_url)
+
+        self.assertEqual(len(response.json()), 2)
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_list_from_primary(self):
+        databases = []
+
+        def get_queryset(viewset):
+            databases.append(ReplicaRouter().db_for_read(Verzoek))
+            return Verzoek.objects.none()
+
+        with patch.object(VerzoekViewSet, "get_queryset", get_queryset):
+            response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(databases, [None])
+
+    def test_list_query_params(self):
+        klantverzoek = KlantVerzoekFactory.create()
+        KlantVerzoekFactory.create()
+        list_url = reverse(KlantVerzoek)
+        self.client.get(list_url)
+
+        response = self.client.get(list_url, {"klant": klantverzoek.klant})
+
+        self.assertEqual(len(response.json()), 1)
+
+    def test_list_single_flight(self):
+        list_url = reverse(Verzoek)
+        VerzoekFactory.create()
+        self.client.get(list_url)
+        VerzoekFactory.create()
+        self.run_commit_hooks()
+        [key] = [
+            key
+            for key in caches["responses"]._cache
+            if ":response:datamodel.verzoek:list:" in key
+        ]
+        # another process is recomputing the list
+        caches["responses"].add(f"{key.split(':', 2)[2]}:lock", 1)
+
+        response = self.client.get(list_url)
+
+        self.assertEqual(len(response.json()), 1)
+
+        caches["responses"].clear()
+        bump_generation(Verzoek)
+        caches["responses"].add(f"{key.split(':', 2)[2]}:lock", 1)
+
+        # nothing to serve in the meantime
+        response = self.client.get(list_url)
+
+        self.assertEqual(len(response.json()), 2)
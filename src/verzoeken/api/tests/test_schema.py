@@ -0,0 +1,66 @@
+import gzip
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from ..views import get_schema_file
+
+
+class PrerenderedSchemaTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        schema_root = tempfile.TemporaryDirectory()
+        self.addCleanup(schema_root.cleanup)
+
+        overrides = override_settings(SCHEMA_ROOT=schema_root.name)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        call_command("render_schema", stdout=StringIO())
+
+        get_schema_file.cache_clear()
+        self.addCleanup(get_schema_file.cache_clear)
+
+    def test_schema_json(self):
+        response = self.client.get(reverse("schema-json", kwargs={"format": ".json"}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response["X-OAS-Version"], "3.0.0")
+        schema = json.loads(response.content)
+        self.assertEqual(schema["servers"], [{"url": "/api/v1"}])
+        self.assertIn("/verzoeken", schema["paths"])
+
+    def test_schema_gzip(self):
+        url = reverse("schema-json", kwargs={"format": ".yaml"})
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertTrue(
+            gzip.decompress(response.content).startswith(b"openapi: 3.0.0\n")
+        )
+
+    def test_schema_etag(self):
+        url = reverse("schema-json", kwargs={"format": ".json"})
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    @override_settings(DEBUG=True)
+    def test_schema_live_in_debug(self):
+        response = self.client.get(reverse("schema-json", kwargs={"format": ".json"}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
@@ -1,14 +1,31 @@
 from datetime import datetime
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, reverse
 
-from verzoeken.datamodel.constants import VerzoekStatus
-from verzoeken.datamodel.models import Verzoek
-from verzoeken.datamodel.tests.factories import VerzoekFactory
+from verzoeken.datamodel.constants import KlantRol, ObjectTypes, VerzoekStatus
+from verzoeken.datamodel.models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekInformatieObject,
+    VerzoekProduct,
+)
+from verzoeken.datamodel.tests.factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+    VerzoekProductFactory,
+)
+from verzoeken.tests.mixins import VerzoekInformatieObjectSyncMixin
 
 
 class VerzoekTests(JWTAuthMixin, APITestCase):
@@ -25,6 +42,40 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
         data = response.json()
         self.assertEqual(len(data), 2)
 
+    def test_list_verzoeken_zoek(self):
+        list_url = reverse(Verzoek)
+        verzoek1 = VerzoekFactory.create(tekst="Aanvraag parkeervergunning")
+        verzoek2 = VerzoekFactory.create(
+            tekst="Mijn parkeervergunningen zijn verlopen, graag een nieuwe "
+            "parkeervergunning"
+        )
+        VerzoekFactory.create(tekst="Melding losliggende stoeptegel")
+
+        response = self.client.get(list_url, {"zoek": "parkeervergunning"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(
+            [verzoek["url"] for verzoek in data],
+            [
+                f"http://testserver{reverse(verzoek2)}",
+                f"http://testserver{reverse(verzoek1)}",
+            ],
+        )
+
+    def test_zoek_follows_tekst(self):
+        verzoek = VerzoekFactory.create(tekst="Aanvraag parkeervergunning")
+        list_url = reverse(Verzoek)
+
+        response = self.client.patch(reverse(verzoek), {"tekst": "Melding"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(list_url, {"zoek": "parkeervergunning"})
+        self.assertEqual(response.json(), [])
+        response = self.client.get(list_url, {"zoek": "meldingen"})
+        self.assertEqual(len(response.json()), 1)
+
     def test_read_verzoek(self):
         in_te_trekken_verzoek, aangevulde_verzoek = VerzoekFactory.create_batch(2)
         verzoek = VerzoekFactory.create(
@@ -102,3 +153,200 @@ class VerzoekTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Verzoek.objects.count(), 0)
+
+    def test_list_verzoeken_klant(self):
+        list_url = reverse(Verzoek)
+        klant = "http://some.klanten.nl/api/v1/klanten/1"
+        klantverzoek1 = KlantVerzoekFactory.create(klant=klant, rol=KlantRol.initiator)
+        klantverzoek2 = KlantVerzoekFactory.create(
+            klant=klant, rol=KlantRol.belanghebbende
+        )
+        KlantVerzoekFactory.create(
+            verzoek=klantverzoek2.verzoek,
+            klant="http://some.klanten.nl/api/v1/klanten/2",
+            rol=KlantRol.initiator,
+        )
+        KlantVerzoekFactory.create(klant="http://some.klanten.nl/api/v1/klanten/3")
+
+        response = self.client.get(list_url, {"klant": klant})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {verzoek["url"] for verzoek in response.json()},
+            {
+                f"http://testserver{reverse(klantverzoek.verzoek)}"
+                for klantverzoek in [klantverzoek1, klantverzoek2]
+            },
+        )
+
+        # the rol applies to the klant, not to the other klanten of the verzoek
+        response = self.client.get(
+            list_url, {"klant": klant, "rol": KlantRol.initiator}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzoek["url"] for verzoek in response.json()],
+            [f"http://testserver{reverse(klantverzoek1.verzoek)}"],
+        )
+
+    def test_list_verzoeken_klant_status(self):
+        list_url = reverse(Verzoek)
+        klant = "http://some.klanten.nl/api/v1/klanten/1"
+        klantverzoek = KlantVerzoekFactory.create(
+            klant=klant, verzoek__status=VerzoekStatus.ontvangen
+        )
+        KlantVerzoekFactory.create(
+            klant=klant, verzoek__status=VerzoekStatus.afgehandeld
+        )
+
+        response = self.client.get(
+            list_url, {"klant": klant, "status": VerzoekStatus.ontvangen}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzoek["url"] for verzoek in response.json()],
+            [f"http://testserver{reverse(klantverzoek.verzoek)}"],
+        )
+
+    def test_list_verzoeken_rol(self):
+        list_url = reverse(Verzoek)
+        verzoek = VerzoekFactory.create()
+        KlantVerzoekFactory.create_batch(
+            2, verzoek=verzoek, rol=KlantRol.belanghebbende
+        )
+        KlantVerzoekFactory.create(rol=KlantRol.initiator)
+
+        response = self.client.get(list_url, {"rol": KlantRol.belanghebbende})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzoek["url"] for verzoek in response.json()],
+            [f"http://testserver{reverse(verzoek)}"],
+        )
+
+    def test_list_verzoeken_object(self):
+        list_url = reverse(Verzoek)
+        zaak = "http://some.zaken.nl/api/v1/zaken/1"
+        objectverzoek1 = ObjectVerzoekFactory.create(object=zaak)
+        objectverzoek2 = ObjectVerzoekFactory.create(object=zaak)
+        ObjectVerzoekFactory.create(object="http://some.zaken.nl/api/v1/zaken/2")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                list_url, {"object": zaak, "objectType": ObjectTypes.zaak}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {verzoek["url"] for verzoek in response.json()},
+            {
+                f"http://testserver{reverse(objectverzoek.verzoek)}"
+                for objectverzoek in [objectverzoek1, objectverzoek2]
+            },
+        )
+        verzoek_queries = [
+            query
+            for query in context.captured_queries
+            if '"datamodel_objectverzoek"' in query["sql"]
+        ]
+        self.assertEqual(len(verzoek_queries), 1)
+
+    def test_list_verzoeken_registratiedatum(self):
+        list_url = reverse(Verzoek)
+        VerzoekFactory.create(registratiedatum=make_aware(datetime(2019, 12, 31)))
+        verzoek = VerzoekFactory.create(
+            registratiedatum=make_aware(datetime(2020, 1, 1))
+        )
+        VerzoekFactory.create(registratiedatum=make_aware(datetime(2020, 2, 1)))
+
+        response = self.client.get(
+            list_url,
+            {
+                "registratiedatum__gte": "2020-01-01T00:00:00+01:00",
+                "registratiedatum__lt": "2020-02-01T00:00:00+01:00",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzoek["url"] for verzoek in response.json()],
+            [f"http://testserver{reverse(verzoek)}"],
+        )
+
+
+class VerzoekKetenTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_keten(self):
+        verzoek1 = VerzoekFactory.create()
+        verzoek2 = VerzoekFactory.create(aangevulde_verzoek=verzoek1)
+        verzoek3 = VerzoekFactory.create(in_te_trekken_verzoek=verzoek2)
+        verzoek4 = VerzoekFactory.create(aangevulde_verzoek=verzoek2)
+        VerzoekFactory.create()
+        keten_url = reverse("verzoek-keten", kwargs={"uuid": verzoek2.uuid})
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(keten_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzoek["url"] for verzoek in response.json()],
+            [
+                f"http://testserver{reverse(verzoek)}"
+                for verzoek in [verzoek1, verzoek2, verzoek3, verzoek4]
+            ],
+        )
+        keten_queries = [
+            query for query in context.captured_queries if "RECURSIVE" in query["sql"]
+        ]
+        self.assertEqual(len(keten_queries), 1)
+
+    def test_keten_max_diepte(self):
+        verzoeken = [VerzoekFactory.create()]
+        for _ in range(5):
+            verzoeken.append(VerzoekFactory.create(aangevulde_verzoek=verzoeken[-1]))
+
+        keten = Verzoek.objects.keten(verzoeken[0], max_diepte=3)
+
+        self.assertEqual(set(keten), set(verzoeken[:4]))
+
+
+class VerzoekDestroyTests(VerzoekInformatieObjectSyncMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_destroy_verzoek_with_relations(self):
+        verzoek = VerzoekFactory.create()
+        intrekkende_verzoek = VerzoekFactory.create(in_te_trekken_verzoek=verzoek)
+        aanvullende_verzoek = VerzoekFactory.create(
+            aangevulde_verzoek=intrekkende_verzoek
+        )
+        for _verzoek in [verzoek, intrekkende_verzoek, aanvullende_verzoek]:
+            ObjectVerzoekFactory.create_batch(3, verzoek=_verzoek)
+            VerzoekProductFactory.create_batch(3, verzoek=_verzoek)
+            VerzoekContactMomentFactory.create_batch(3, verzoek=_verzoek)
+            KlantVerzoekFactory.create_batch(3, verzoek=_verzoek)
+        vios = VerzoekInformatieObjectFactory.create_batch(
+            2, verzoek=verzoek
+        ) + VerzoekInformatieObjectFactory.create_batch(2, verzoek=aanvullende_verzoek)
+        other_verzoek = VerzoekFactory.create()
+        ObjectVerzoekFactory.create(verzoek=other_verzoek)
+
+        response = self.client.delete(reverse(verzoek))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(list(Verzoek.objects.all()), [other_verzoek])
+        self.assertEqual(ObjectVerzoek.objects.get().verzoek, other_verzoek)
+        self.assertFalse(VerzoekProduct.objects.exists())
+        self.assertFalse(VerzoekContactMoment.objects.exists())
+        self.assertFalse(KlantVerzoek.objects.exists())
+        self.assertFalse(VerzoekInformatieObject.objects.exists())
+
+        # the remote relations are deleted in one go
+        self.mocked_sync_delete_vio.assert_not_called()
+        self.mocked_sync_delete_vios.assert_called_once()
+        self.assertEqual(
+            {vio.pk for vio in self.mocked_sync_delete_vios.call_args[0][0]},
+            {vio.pk for vio in vios},
+        )
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from django.core.management import call_command
+from django.utils.timezone import make_aware
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.tests.factories import VerzoekFactory
+
+
+class VerzoekStatistiekTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        # wednesday and sunday of the same week
+        for day in (3, 7):
+            VerzoekFactory.create(
+                bronorganisatie="517439943",
+                status=VerzoekStatus.ontvangen,
+                voorkeurskanaal="email",
+                registratiedatum=make_aware(datetime(2019, 7, day, 12)),
+            )
+        VerzoekFactory.create(
+            bronorganisatie="517439943",
+            status=VerzoekStatus.afgehandeld,
+            voorkeurskanaal="email",
+            registratiedatum=make_aware(datetime(2019, 7, 8, 12)),
+        )
+
+    def test_list_statistieken(self):
+        call_command("refresh_statistieken")
+
+        response = self.client.get(get_operation_url("verzoekstatistiek_list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "week": "2019-07-01",
+                    "bronorganisatie": "517439943",
+                    "status": VerzoekStatus.ontvangen,
+                    "voorkeurskanaal": "email",
+                    "aantal": 2,
+                },
+                {
+                    "week": "2019-07-08",
+                    "bronorganisatie": "517439943",
+                    "status": VerzoekStatus.afgehandeld,
+                    "voorkeurskanaal": "email",
+                    "aantal": 1,
+                },
+            ],
+        )
+
+    def test_filter_statistieken(self):
+        call_command("refresh_statistieken")
+
+        response = self.client.get(
+            get_operation_url("verzoekstatistiek_list"),
+            {"week__gte": "2019-07-08", "status": VerzoekStatus.afgehandeld},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["aantal"], 1)
+
+    def test_statistieken_not_refreshed(self):
+        response = self.client.get(get_operation_url("verzoekstatistiek_list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [])
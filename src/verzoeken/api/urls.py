@@ -4,6 +4,7 @@ from django.urls import include, path
 from vng_api_common import routers
 from vng_api_common.schema import SchemaView
 
+from .views import PrerenderedSchemaView
 from .viewsets import (
     KlantVerzoekViewSet,
     ObjectVerzoekViewSet,
@@ -11,6 +12,7 @@ from .viewsets import (
     VerzoekContactMomentViewSet,
     VerzoekInformatieObjectViewSet,
     VerzoekProductViewSet,
+    VerzoekStatistiekViewSet,
     VerzoekViewSet,
 )
 
@@ -25,6 +27,7 @@ router.register("objectverzoeken", ObjectVerzoekViewSet)
 router.register("verzoekinformatieobjecten", VerzoekInformatieObjectViewSet)
 router.register("verzoekcontactmomenten", VerzoekContactMomentViewSet)
 router.register("verzoekproducten", VerzoekProductViewSet)
+router.register("verzoekstatistieken", VerzoekStatistiekViewSet)
 
 # TODO: the EndpointEnumerator seems to choke on path and re_path
 
@@ -36,7 +39,7 @@ urlpatterns = [
                 # API documentation
                 url(
                     r"^schema/openapi(?P<format>\.json|\.yaml)$",
-                    SchemaView.without_ui(cache_timeout=None),
+                    PrerenderedSchemaView.as_view(),
                     name="schema-json",
                 ),
                 url(
@@ -48,6 +51,8 @@ urlpatterns = [
                 url(r"^", include(router.urls)),
                 # should not be picked up by drf-yasg
                 path("", include("vng_api_common.api.urls")),
+                # receives the notifications of the Autorisaties API
+                path("", include("vng_api_common.notifications.api.urls")),
             ]
         ),
     )
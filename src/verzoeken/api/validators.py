@@ -1,17 +1,18 @@
 from collections import OrderedDict
+from functools import partial
 
 from django.conf import settings
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import exceptions, serializers
-from vng_api_common.models import APICredential
 from vng_api_common.validators import ResourceValidator
 from zds_client import ClientError
 
 from verzoeken.datamodel.models import ObjectVerzoek
+from verzoeken.utils.concurrency import run_concurrently
 
-from .auth import get_auth
+from .auth import get_auth, get_client_auth
 from .utils import get_absolute_url
 
 
@@ -31,7 +32,7 @@ class ObjectVerzoekDestroyValidator:
 
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_client_auth(object_url)
 
         resource = f"{objectklantinteractie.object_type}{self.resource_name}"
 
@@ -71,32 +72,38 @@ class ObjectVerzoekCreateValidator:
         # dynamic so that it can be mocked in tests easily
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_client_auth(object_url)
 
         resource = f"{object_type}{self.resource_name}"
         oas_schema = settings.ZRC_API_SPEC
 
-        try:
+        # resolved here, the remote calls don't run in the thread of the request
+        auth_headers = get_auth(object_url)
+        validate_object = partial(
             ResourceValidator(
                 object_type.capitalize(),
                 oas_schema,
-                get_auth=get_auth,
+                get_auth=lambda url: auth_headers,
                 headers={"Accept-Crs": "EPSG:4326"},
-            )(object_url)
+            ),
+            object_url,
+        )
+        list_relations = partial(
+            client.list,
+            resource,
+            query_params={
+                object_type: object_url,
+                f"{self.resource_name}": klantinteractie_url,
+            },
+        )
+
+        # the remote calls don't depend on each other
+        try:
+            _, relations = run_concurrently(validate_object, list_relations)
         except exceptions.ValidationError as exc:
             raise serializers.ValidationError(
                 {"object": exc.detail}, code=ResourceValidator.code
             )
-
-        try:
-            relations = client.list(
-                resource,
-                query_params={
-                    object_type: object_url,
-                    f"{self.resource_name}": klantinteractie_url,
-                },
-            )
-
         except ClientError as exc:
             raise serializers.ValidationError(
                 exc.args[0], code="relation-validation-error"
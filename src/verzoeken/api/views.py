@@ -0,0 +1,147 @@
+"""
+Serve the OpenAPI 3 schema from pre-rendered files.
+
+The ``render_schema`` management command renders ``src/openapi.yaml`` to JSON
+and YAML files in ``SCHEMA_ROOT``, and compresses them with gzip. The schema
+endpoint serves these files as they are, with an ETag, instead of loading and
+dumping the schema on every request. Without the files (e.g. when running
+the tests) the schema is rendered once per process.
+"""
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
+
+from drf_yasg.codecs import yaml_sane_dump, yaml_sane_load
+from vng_api_common.schema import SchemaView
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    ".json": "application/json",
+    ".yaml": "application/yaml; charset=utf-8",
+}
+
+re_accepts_gzip = re.compile(r"\bgzip\b")
+re_oas_version = re.compile(r'"?openapi"?:\s*"?([\d.]+)')
+
+
+class SchemaFile(NamedTuple):
+    content: bytes
+    compressed: bytes
+    etag: str
+    oas_version: str
+
+
+def get_schema_path() -> str:
+    return os.path.join(settings.BASE_DIR, "src", "openapi.yaml")
+
+
+def render_schema() -> Dict[str, bytes]:
+    """
+    Render the schema in all formats, like ``vng_api_common.schema.SchemaView``.
+
+    The servers are kept relative to the host of the schema.
+    """
+    with open(get_schema_path(), "r") as infile:
+        schema = yaml_sane_load(infile)
+
+    prefix = (settings.FORCE_SCRIPT_NAME or "").rstrip("/")
+    for server in schema["servers"]:
+        if server["url"].startswith("/"):
+            server["url"] = f"{prefix}{server['url']}"
+
+    return {
+        ".json": json.dumps(schema).encode("utf-8"),
+        ".yaml": yaml_sane_dump(schema, False).encode("utf-8"),
+    }
+
+
+def compress(content: bytes) -> bytes:
+    # a fixed mtime keeps the compressed files reproducible
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=9, mtime=0) as outfile:
+        outfile.write(content)
+    return buffer.getvalue()
+
+
+def write_schema_files(directory: str) -> List[str]:
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for format, content in render_schema().items():
+        path = os.path.join(directory, f"openapi{format}")
+        with open(path, "wb") as outfile:
+            outfile.write(content)
+        with open(f"{path}.gz", "wb") as outfile:
+            outfile.write(compress(content))
+        paths += [path, f"{path}.gz"]
+    return paths
+
+
+@lru_cache(maxsize=None)
+def get_schema_file(format: str) -> SchemaFile:
+    path = os.path.join(settings.SCHEMA_ROOT, f"openapi{format}")
+    try:
+        with open(path, "rb") as infile:
+            content = infile.read()
+        with open(f"{path}.gz", "rb") as infile:
+            compressed = infile.read()
+    except FileNotFoundError:
+        logger.warning(
+            "No pre-rendered schema in %s, run the render_schema command",
+            settings.SCHEMA_ROOT,
+        )
+        content = render_schema()[format]
+        compressed = compress(content)
+
+    return SchemaFile(
+        content=content,
+        compressed=compressed,
+        etag=hashlib.sha256(content).hexdigest()[:32],
+        oas_version=re_oas_version.search(content.decode("utf-8")).group(1),
+    )
+
+
+class PrerenderedSchemaView(View):
+    """
+    Serve the pre-rendered OpenAPI 3 schema.
+
+    The schema is only generated for every request in DEBUG mode, so changes
+    show up immediately, and for the OpenAPI 2 version (``?v=2``).
+    """
+
+    live_view = staticmethod(SchemaView.without_ui(cache_timeout=None))
+
+    def get(self, request, *args, **kwargs):
+        if settings.DEBUG or request.GET.get("v", "3").startswith("2"):
+            return self.live_view(request, *args, **kwargs)
+
+        schema_file = get_schema_file(kwargs["format"])
+        use_gzip = re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        # the representations differ, so do their ETags
+        etag = f'"{schema_file.etag}-gzip"' if use_gzip else f'"{schema_file.etag}"'
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                schema_file.compressed if use_gzip else schema_file.content,
+                content_type=CONTENT_TYPES[kwargs["format"]],
+            )
+            if use_gzip:
+                response["Content-Encoding"] = "gzip"
+            response["X-OAS-Version"] = schema_file.oas_version
+
+        response["ETag"] = etag
+        response["Vary"] = "Accept-Encoding"
+        return response
@@ -2,7 +2,10 @@ import logging
 
 from django.core.cache import caches
 
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
 from vng_api_common.audittrails.viewsets import (
@@ -26,15 +29,22 @@ from verzoeken.datamodel.models import (
     VerzoekContactMoment,
     VerzoekInformatieObject,
     VerzoekProduct,
+    VerzoekStatistiek,
 )
+from verzoeken.notifications.viewsets import QueuedNotificationMixin
+from verzoeken.sync.signals import remote_relations_deleted, sync_delete_vios
 
 from .audits import AUDIT_VERZOEKEN
+from .caching import CachedListMixin, CachedRetrieveMixin
+from .compiled import CompiledListMixin
 from .filters import (
     KlantVerzoekFilter,
     ObjectVerzoekFilter,
     VerzoekContactMomentFilter,
+    VerzoekFilter,
     VerzoekInformatieObjectFilter,
     VerzoekProductFilter,
+    VerzoekStatistiekFilter,
 )
 from .kanalen import KANAAL_VERZOEKEN
 from .scopes import (
@@ -50,6 +60,7 @@ from .serializers import (
     VerzoekInformatieObjectSerializer,
     VerzoekProductSerializer,
     VerzoekSerializer,
+    VerzoekStatistiekSerializer,
 )
 from .validators import ObjectVerzoekDestroyValidator
 
@@ -57,7 +68,13 @@ logger = logging.getLogger(__name__)
 
 
 class VerzoekViewSet(
-    NotificationViewSetMixin, AuditTrailViewsetMixin, viewsets.ModelViewSet
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
+    QueuedNotificationMixin,
+    NotificationViewSetMixin,
+    AuditTrailViewsetMixin,
+    viewsets.ModelViewSet,
 ):
     """
     Opvragen en bewerken van VERZOEKen.
@@ -91,10 +108,19 @@ class VerzoekViewSet(
     Verwijder een VERZOEK.
 
     Verwijder een VERZOEK.
+
+    keten:
+    De keten van een VERZOEK opvragen.
+
+    Alle VERZOEKen opvragen die via intrekkingen en aanvullingen met het
+    VERZOEK verbonden zijn, inclusief het VERZOEK zelf, in volgorde van
+    registratie. De keten wordt tot maximaal 50 stappen vanaf het VERZOEK
+    gevolgd.
     """
 
-    queryset = Verzoek.objects.all()
+    queryset = Verzoek.objects.defer("zoek_vector")
     serializer_class = VerzoekSerializer
+    filterset_class = VerzoekFilter
     lookup_field = "uuid"
     permission_classes = (AuthScopesRequired,)
     required_scopes = {
@@ -104,12 +130,48 @@ class VerzoekViewSet(
         "update": SCOPE_VERZOEKEN_BIJWERKEN,
         "partial_update": SCOPE_VERZOEKEN_BIJWERKEN,
         "destroy": SCOPE_VERZOEKEN_ALLES_VERWIJDEREN,
+        "keten": SCOPE_VERZOEKEN_ALLES_LEZEN,
     }
     notifications_kanaal = KANAAL_VERZOEKEN
     audit = AUDIT_VERZOEKEN
+    # the klant and object filters
+    list_cache_models = (Verzoek, KlantVerzoek, ObjectVerzoek)
+
+    @swagger_auto_schema(responses={200: VerzoekSerializer(many=True)})
+    @action(detail=True, methods=["get"])
+    def keten(self, request, *args, **kwargs):
+        verzoek = self.get_object()
+        keten = (
+            Verzoek.objects.keten(verzoek)
+            .defer("zoek_vector")
+            .order_by("registratiedatum", "pk")
+        )
+        serializer = self.get_serializer(keten, many=True)
+        return Response(serializer.data)
+
+    def perform_destroy(self, instance):
+        # The other relations are deleted by the database (see migration
+        # 0013), the remote relations of the informatieobjecten are deleted in
+        # batches instead of one VerzoekInformatieObject at a time.
+        vios = list(
+            VerzoekInformatieObject.objects.filter(
+                verzoek__in=instance.get_chained_pks()
+            ).select_related("verzoek")
+        )
+        if vios:
+            sync_delete_vios(vios)
+            with remote_relations_deleted(vios):
+                VerzoekInformatieObject.objects.filter(
+                    pk__in=[vio.pk for vio in vios]
+                ).delete()
+
+        super().perform_destroy(instance)
 
 
 class ObjectVerzoekViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
     CheckQueryParamsMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -179,6 +241,10 @@ class ObjectVerzoekViewSet(
 
 
 class VerzoekInformatieObjectViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
+    QueuedNotificationMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -254,22 +320,35 @@ class VerzoekInformatieObjectViewSet(
         "partial_update": SCOPE_VERZOEKEN_BIJWERKEN,
     }
     notifications_kanaal = KANAAL_VERZOEKEN
+    # the DRC looks the relation up in this API while it's synced
+    notifications_atomic = False
     audit = AUDIT_VERZOEKEN
 
+    def get_marked_vios(self) -> list:
+        cache = caches["drc_sync"]
+
+        # TODO: Store cachekeys somewhere central.
+        return cache.get("vios_marked_for_delete") or []
+
     def get_queryset(self):
         qs = super().get_queryset()
 
         # Do not display VerzoekInformatieObjecten that are marked to be deleted
-        cache = caches["drc_sync"]
-
-        # TODO: Store cachekeys somewhere central.
-        marked_vios = cache.get("vios_marked_for_delete")
+        marked_vios = self.get_marked_vios()
         if marked_vios:
             return qs.exclude(uuid__in=marked_vios)
         return qs
 
+    def use_response_cache(self) -> bool:
+        # the DRC checks that the relation is gone before it is deleted
+        return super().use_response_cache() and not self.get_marked_vios()
+
 
 class VerzoekContactMomentViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
+    QueuedNotificationMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -345,6 +424,10 @@ class VerzoekContactMomentViewSet(
 
 
 class VerzoekProductViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
+    QueuedNotificationMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -401,6 +484,10 @@ class VerzoekProductViewSet(
 
 
 class KlantVerzoekViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    CompiledListMixin,
+    QueuedNotificationMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -465,3 +552,25 @@ class VerzoekAuditTrailViewSet(AuditTrailViewSet):
     """
 
     main_resource_lookup_field = "verzoek_uuid"
+
+
+class VerzoekStatistiekViewSet(
+    CheckQueryParamsMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """
+    Opvragen van statistieken over VERZOEKen.
+
+    list:
+    Het aantal VERZOEKen per week, bronorganisatie, status en voorkeurskanaal.
+
+    Het aantal VERZOEKen per week, bronorganisatie, status en voorkeurskanaal.
+    Deze aantallen worden periodiek berekend en lopen dus enigszins achter.
+    """
+
+    queryset = VerzoekStatistiek.objects.order_by(
+        "week", "bronorganisatie", "status", "voorkeurskanaal"
+    )
+    serializer_class = VerzoekStatistiekSerializer
+    filterset_class = VerzoekStatistiekFilter
+    permission_classes = (AuthScopesRequired,)
+    required_scopes = {"list": SCOPE_VERZOEKEN_ALLES_LEZEN}
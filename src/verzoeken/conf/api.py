@@ -3,6 +3,13 @@ from vng_api_common.conf.api import *  # noqa - imports white-listed
 API_VERSION = "1.0.0-beta"
 
 REST_FRAMEWORK = BASE_REST_FRAMEWORK.copy()
+REST_FRAMEWORK.update(
+    {
+        # same output as djangorestframework-camel-case, see the modules
+        "DEFAULT_RENDERER_CLASSES": ("verzoeken.api.renderers.CamelCaseJSONRenderer",),
+        "DEFAULT_PARSER_CLASSES": ("verzoeken.api.parsers.CamelCaseJSONParser",),
+    }
+)
 
 SECURITY_DEFINITION_NAME = "JWT-Claims"
 
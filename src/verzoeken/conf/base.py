@@ -34,6 +34,29 @@ DATABASES = {
     }
 }
 
+# Optional read replicas, a comma separated list of "host" or "host:port".
+# Safe requests read from a replica, see ``verzoeken.utils.replicas``.
+DATABASE_REPLICAS = []
+for _index, _replica in enumerate(
+    filter(None, os.getenv("DB_REPLICAS", "").split(","))
+):
+    _host, _, _port = _replica.strip().partition(":")
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "PORT": _port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index}")
+
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["verzoeken.utils.replicas.ReplicaRouter"]
+
+# Cache (alias) to pin clients to the primary database after a write, and
+# the seconds they stay pinned. Should exceed the replication lag.
+DATABASE_REPLICA_CACHE = "db_routing"
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 5))
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -64,24 +87,39 @@ INSTALLED_APPS = [
     "verzoeken.accounts",
     "verzoeken.api",
     "verzoeken.datamodel",
+    "verzoeken.notifications",
     "verzoeken.sync",
     "verzoeken.utils",
 ]
 
 MIDDLEWARE = [
+    "verzoeken.utils.health.HealthCheckMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
     "django.middleware.common.CommonMiddleware",
+    "verzoeken.utils.middleware.NonAPIMiddleware",
+    "verzoeken.api.middleware.CachedAuthMiddleware",
+    "verzoeken.utils.replicas.ReplicaRoutingMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "vng_api_common.middleware.APIVersionHeaderMiddleware",
+]
+
+# Middleware for all requests outside of the API (the admin and the other
+# pages), run in place of the ``NonAPIMiddleware``. API requests are
+# authenticated with JWTs, see ``verzoeken.utils.middleware``.
+API_PATH_PREFIXES = ("/api/",)
+NON_API_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "vng_api_common.middleware.AuthMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "corsheaders.middleware.CorsMiddleware",
-    "vng_api_common.middleware.APIVersionHeaderMiddleware",
 ]
 
+# The admin checks only look for its middleware in MIDDLEWARE, the
+# ``utils.E002`` check replaces them.
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 ROOT_URLCONF = "verzoeken.urls"
 
 # List of callables that know how to import templates from various sources.
@@ -170,6 +208,9 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 MEDIA_URL = "/media/"
 
+# The OpenAPI schema files rendered by the ``render_schema`` command
+SCHEMA_ROOT = os.path.join(BASE_DIR, "schema")
+
 FIXTURE_DIRS = (os.path.join(DJANGO_PROJECT_DIR, "fixtures"),)
 
 DEFAULT_FROM_EMAIL = "verzoeken@example.com"
@@ -303,5 +344,56 @@ if SENTRY_DSN:
 
 IS_HTTPS = os.getenv("IS_HTTPS", "1").lower() in ["true", "1", "yes"]
 
+# Cache (alias) for the verified JWT payloads and the resolved authorizations
+# of the clients. Changes to the authorizations invalidate the whole cache.
+AUTH_CACHE = "auth"
+AUTH_CACHE_TIMEOUT = int(os.getenv("AUTH_CACHE_TIMEOUT", 5 * 60))
+
+# Cache (alias) for the responses of the retrieve operations, see
+# ``verzoeken.api.caching``. Only used if RESPONSE_CACHE_ENABLED is set.
+RESPONSE_CACHE = "responses"
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 60 * 60))
+
+# Seconds before the in-process index of the external API credentials is
+# reloaded, to pick up changes made in other processes.
+API_CREDENTIAL_INDEX_TIMEOUT = int(os.getenv("API_CREDENTIAL_INDEX_TIMEOUT", 60))
+
+# Threads per process for the remote calls of a request that are done
+# concurrently, see ``verzoeken.utils.concurrency``. 1 disables the pool.
+REMOTE_CALL_WORKERS = int(os.getenv("REMOTE_CALL_WORKERS", 8))
+
+# Seconds the database and the caches get to answer the readiness probe, see
+# ``verzoeken.utils.health``.
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 1))
+HEALTH_CHECK_CACHES = ["drc_sync"]
+
+# Seconds the warm-up waits for the specs of the remote APIs, see
+# ``verzoeken.utils.warmup``. They're fetched on first use otherwise.
+WARM_UP_FETCH_TIMEOUT = float(os.getenv("WARM_UP_FETCH_TIMEOUT", 5))
+
 # settings for sending notifications
 NOTIFICATIONS_KANAAL = "verzoeken"
+
+# Queue notifications and deliver them with the ``deliver_notifications``
+# management command instead of sending them during the request.
+NOTIFICATIONS_QUEUED = os.getenv("NOTIFICATIONS_QUEUED", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+NOTIFICATIONS_QUEUE_BATCH_SIZE = int(os.getenv("NOTIFICATIONS_QUEUE_BATCH_SIZE", 50))
+NOTIFICATIONS_QUEUE_CONCURRENCY = int(os.getenv("NOTIFICATIONS_QUEUE_CONCURRENCY", 4))
+NOTIFICATIONS_QUEUE_MAX_ATTEMPTS = int(
+    os.getenv("NOTIFICATIONS_QUEUE_MAX_ATTEMPTS", 10)
+)
+NOTIFICATIONS_QUEUE_POLL_INTERVAL = float(
+    os.getenv("NOTIFICATIONS_QUEUE_POLL_INTERVAL", 1)
+)
+# Hold queued notifications back for this many seconds, merging successive
+# updates of the same resource into one notification. Disabled with 0.
+NOTIFICATIONS_COALESCE_WINDOW = float(os.getenv("NOTIFICATIONS_COALESCE_WINDOW", 0))
@@ -24,6 +24,9 @@ MANAGERS = ADMINS
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "drc_sync": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "auth": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "db_routing": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "responses": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
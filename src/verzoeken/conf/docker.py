@@ -40,6 +40,36 @@ CACHES = {
             "IGNORE_EXCEPTIONS": True,
         },
     },
+    # shared between all processes, see AUTH_CACHE
+    "auth": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{getenv('REDIS_CACHE')}",
+        "KEY_PREFIX": "verzoeken",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
+    # shared between all processes, see DATABASE_REPLICA_CACHE
+    "db_routing": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{getenv('REDIS_CACHE')}",
+        "KEY_PREFIX": "verzoeken",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
+    # shared between all processes, see RESPONSE_CACHE
+    "responses": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{getenv('REDIS_CACHE')}",
+        "KEY_PREFIX": "verzoeken",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
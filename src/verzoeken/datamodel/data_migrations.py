@@ -0,0 +1,66 @@
+from django.contrib.postgres.search import SearchVector
+
+from verzoeken.utils.data_migrations import DataMigration
+
+from .fields import url_hash
+
+
+def fill_url_hash(field: str):
+    hash_field = f"{field}_hash"
+
+    def process(apps, batch):
+        model = type(batch[0])
+        for instance in batch:
+            setattr(instance, hash_field, url_hash(getattr(instance, field)))
+        model._default_manager.bulk_update(batch, [hash_field])
+
+    return process
+
+
+def fill_zoek_vector(apps, batch):
+    Verzoek = apps.get_model("datamodel", "Verzoek")
+    Verzoek.objects.filter(pk__in=[verzoek.pk for verzoek in batch]).update(
+        zoek_vector=SearchVector("tekst", config="pg_catalog.dutch")
+    )
+
+
+URL_HASH_MIGRATIONS = [
+    DataMigration(
+        f"datamodel.fill_{field}_hash",
+        f"datamodel.{model}",
+        process=fill_url_hash(field),
+        filters={f"{field}_hash__isnull": True, f"{field}__gt": ""},
+    )
+    for model, field in [
+        ("ObjectVerzoek", "object"),
+        ("VerzoekProduct", "product"),
+        ("VerzoekInformatieObject", "informatieobject"),
+        ("VerzoekContactMoment", "contactmoment"),
+        ("KlantVerzoek", "klant"),
+    ]
+]
+
+
+def fill_remaining_url_hashes(apps, schema_editor):
+    """
+    Fill the hashes of the rows written by pods running old code since the
+    URL hash migrations were run.
+
+    The tables are locked until the end of the transaction, so no rows without
+    a hash are written before the hash columns are made ``NOT NULL``.
+    """
+    for data_migration in URL_HASH_MIGRATIONS:
+        model = apps.get_model(data_migration.model)
+        schema_editor.execute(
+            "LOCK TABLE %s IN SHARE ROW EXCLUSIVE MODE"
+            % schema_editor.quote_name(model._meta.db_table)
+        )
+        data_migration.run(apps=apps)
+
+
+FILL_ZOEK_VECTOR = DataMigration(
+    "datamodel.fill_zoek_vector",
+    "datamodel.Verzoek",
+    process=fill_zoek_vector,
+    filters={"zoek_vector__isnull": True},
+)
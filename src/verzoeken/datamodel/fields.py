@@ -0,0 +1,37 @@
+import hashlib
+from typing import Optional
+
+from django.db import models
+
+URL_HASH_SIZE = 16
+
+
+def url_hash(url: str) -> Optional[bytes]:
+    if not url:
+        return None
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=URL_HASH_SIZE).digest()
+
+
+class URLHashField(models.BinaryField):
+    """
+    Fixed-width digest of an URL field of the same model, for lookups.
+
+    The digest is computed on save (and ``bulk_create``), so
+    ``QuerySet.update`` and ``bulk_update`` of the URL must set it as well.
+    """
+
+    def __init__(self, *args, source: str, **kwargs):
+        self.source = source
+        kwargs["max_length"] = URL_HASH_SIZE
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        del kwargs["max_length"]
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = url_hash(getattr(model_instance, self.source))
+        setattr(model_instance, self.attname, value)
+        return value
@@ -0,0 +1,148 @@
+"""
+Allocate the numbers of generated identificaties with Postgres sequences.
+
+There is a sequence per bronorganisatie and year, created on first use and
+started after the highest number already issued. ``nextval`` is atomic and
+not transactional, so concurrent creates never get the same number and never
+wait for each other. Numbers of rolled back creates are skipped.
+
+Identificaties in the generated format can also be given by the client. The
+sequence is moved past those when they are created, so it never hands them out
+again. The move holds an advisory lock on the sequence, which ``nextval`` takes
+shared, until the instance is saved: creates don't wait for each other, but
+the sequence can't advance between the check and the move, and a given number
+that was just handed out is rejected as a duplicate.
+"""
+import hashlib
+import re
+from typing import Optional, Tuple
+
+from django.db import IntegrityError, ProgrammingError, connection, models, transaction
+from django.db.models import Max
+
+SEQUENCE_NAME = "{table}_identificatie_{bronorganisatie}_{year}"
+
+# the sequence name ends up in DDL, so it's limited to these characters
+re_sequence_name = re.compile(r"^[a-z0-9_]{1,63}$")
+
+
+def get_model_name(instance: models.Model) -> str:
+    model = type(instance)
+    return getattr(model, "IDENTIFICATIE_PREFIX", model._meta.model_name.upper())
+
+
+def get_prefix(instance: models.Model, year: int) -> str:
+    return f"{get_model_name(instance)}-{year}"
+
+
+def get_issued_number(instance: models.Model, prefix: str) -> int:
+    max_id = (
+        type(instance)
+        ._default_manager.filter(
+            bronorganisatie=instance.bronorganisatie,
+            identificatie__regex=rf"^{prefix}-\d{{10}}$",
+        )
+        .aggregate(Max("identificatie"))["identificatie__max"]
+    )
+    return int(max_id.split("-")[-1]) if max_id else 0
+
+
+def get_sequence_name(instance: models.Model, year: int) -> str:
+    bronorganisatie = str(instance.bronorganisatie)
+    if not re.match(r"^[0-9]+$", bronorganisatie):
+        # not an RSIN, the name must stay short and safe
+        bronorganisatie = hashlib.sha1(bronorganisatie.encode("utf-8")).hexdigest()[:16]
+
+    name = SEQUENCE_NAME.format(
+        table=instance._meta.db_table, bronorganisatie=bronorganisatie, year=year
+    )
+    if not re_sequence_name.match(name):
+        raise ValueError(f"Invalid sequence name {name!r}")
+    return connection.ops.quote_name(name)
+
+
+def get_lock_key(sequence: str) -> int:
+    """
+    Return the key of the advisory lock of the sequence, a signed 64 bit int.
+    """
+    digest = hashlib.sha1(sequence.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def next_number(instance: models.Model, prefix: str, year: int) -> int:
+    sequence = get_sequence_name(instance, year)
+
+    with connection.cursor() as cursor, transaction.atomic():
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock_shared(%s)", [get_lock_key(sequence)]
+        )
+        try:
+            with transaction.atomic():
+                cursor.execute("SELECT nextval(%s)", [sequence])
+                return cursor.fetchone()[0]
+        except ProgrammingError:
+            pass
+
+        # the sequence does not exist yet
+        start = get_issued_number(instance, prefix) + 1
+        try:
+            with transaction.atomic():
+                cursor.execute(f"CREATE SEQUENCE {sequence} START WITH {start:d}")
+        except (IntegrityError, ProgrammingError):
+            # created concurrently
+            pass
+
+        cursor.execute("SELECT nextval(%s)", [sequence])
+        return cursor.fetchone()[0]
+
+
+def parse_identificatie(
+    instance: models.Model, identificatie: str
+) -> Optional[Tuple[int, int]]:
+    """
+    Return the year and number of an identificatie in the generated format.
+    """
+    model_name = re.escape(get_model_name(instance))
+    match = re.match(rf"^{model_name}-([0-9]{{4}})-([0-9]{{10}})$", identificatie)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def reserve_identificatie(instance: models.Model) -> None:
+    """
+    Move the sequence past the given identificatie of a new instance, if it's
+    in the generated format.
+    """
+    parsed = parse_identificatie(instance, instance.identificatie)
+    if parsed is None:
+        return
+
+    year, number = parsed
+    sequence = get_sequence_name(instance, year)
+    with connection.cursor() as cursor, transaction.atomic():
+        # no nextval in between the check and the setval
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [get_lock_key(sequence)])
+        try:
+            with transaction.atomic():
+                cursor.execute(
+                    f"SELECT setval(%s, %s) FROM {sequence} WHERE last_value <= %s",
+                    [sequence, number, number],
+                )
+        except ProgrammingError:
+            # the sequence does not exist yet, it starts after the issued numbers
+            pass
+
+
+def generate_identificatie(instance: models.Model, date_field_name: str) -> str:
+    """
+    Generate the identificatie ``<MODEL>-<year>-<number>`` for the instance.
+
+    The number is unique per bronorganisatie and year. Same format as
+    ``vng_api_common.utils.generate_unique_identification``.
+    """
+    year = getattr(instance, date_field_name).year
+    prefix = get_prefix(instance, year)
+
+    number = next_number(instance, prefix, year)
+    return f"{prefix}-{number:010d}"
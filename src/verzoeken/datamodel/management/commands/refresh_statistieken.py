@@ -0,0 +1,29 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...models import VerzoekStatistiek
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Recompute the statistics served by the verzoekstatistieken endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Keep running and recompute the statistics every INTERVAL seconds.",
+        )
+
+    def handle(self, **options):
+        while True:
+            start = time.monotonic()
+            VerzoekStatistiek.objects.refresh()
+            logger.info("Refreshed statistics in %.1fs", time.monotonic() - start)
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
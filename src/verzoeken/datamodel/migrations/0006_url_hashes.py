@@ -0,0 +1,40 @@
+from django.db import migrations
+
+import verzoeken.datamodel.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("datamodel", "0005_auto_20200528_1628")]
+
+    operations = [
+        migrations.AddField(
+            model_name="objectverzoek",
+            name="object_hash",
+            field=verzoeken.datamodel.fields.URLHashField(null=True, source="object"),
+        ),
+        migrations.AddField(
+            model_name="verzoekproduct",
+            name="product_hash",
+            field=verzoeken.datamodel.fields.URLHashField(null=True, source="product"),
+        ),
+        migrations.AddField(
+            model_name="verzoekinformatieobject",
+            name="informatieobject_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                null=True, source="informatieobject"
+            ),
+        ),
+        migrations.AddField(
+            model_name="verzoekcontactmoment",
+            name="contactmoment_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                null=True, source="contactmoment"
+            ),
+        ),
+        migrations.AddField(
+            model_name="klantverzoek",
+            name="klant_hash",
+            field=verzoeken.datamodel.fields.URLHashField(null=True, source="klant"),
+        ),
+    ]
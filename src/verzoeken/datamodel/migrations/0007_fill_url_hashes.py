@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from verzoeken.datamodel.data_migrations import URL_HASH_MIGRATIONS
+
+
+class Migration(migrations.Migration):
+
+    # the data migrations commit per batch
+    atomic = False
+
+    dependencies = [("datamodel", "0006_url_hashes"), ("utils", "0001_initial")]
+
+    operations = [
+        migrations.RunPython(data_migration, migrations.RunPython.noop)
+        for data_migration in URL_HASH_MIGRATIONS
+    ]
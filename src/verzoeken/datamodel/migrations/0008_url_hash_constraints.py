@@ -0,0 +1,67 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:05
+
+from django.db import migrations
+import verzoeken.datamodel.fields
+from verzoeken.datamodel.data_migrations import fill_remaining_url_hashes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0007_fill_url_hashes"),
+    ]
+
+    operations = [
+        # rows written by old pods since 0007, in the transaction that adds the
+        # constraints
+        migrations.RunPython(fill_remaining_url_hashes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="klantverzoek",
+            name="klant_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                db_index=True, source="klant"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="objectverzoek",
+            name="object_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                db_index=True, source="object"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoekcontactmoment",
+            name="contactmoment_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                db_index=True, source="contactmoment"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoekinformatieobject",
+            name="informatieobject_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                db_index=True, source="informatieobject"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoekproduct",
+            name="product_hash",
+            field=verzoeken.datamodel.fields.URLHashField(
+                db_index=True, null=True, source="product"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="klantverzoek", unique_together={("verzoek", "klant_hash")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="objectverzoek", unique_together={("verzoek", "object_hash")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="verzoekcontactmoment",
+            unique_together={("verzoek", "contactmoment_hash")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="verzoekinformatieobject",
+            unique_together={("verzoek", "informatieobject_hash")},
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:09
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0008_url_hash_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="verzoek",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["registratiedatum"], name="verzoek_registratiedatum_brin"
+            ),
+        ),
+    ]
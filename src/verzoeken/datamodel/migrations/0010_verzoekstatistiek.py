@@ -0,0 +1,83 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:11
+
+from django.db import migrations, models
+import vng_api_common.fields
+
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW datamodel_verzoekstatistiek AS
+SELECT
+    row_number() OVER () AS id,
+    date_trunc('week', registratiedatum AT TIME ZONE 'UTC')::date AS week,
+    bronorganisatie,
+    status,
+    voorkeurskanaal,
+    count(*) AS aantal
+FROM datamodel_verzoek
+GROUP BY 2, 3, 4, 5;
+
+-- required to refresh the view concurrently
+CREATE UNIQUE INDEX datamodel_verzoekstatistiek_groep
+ON datamodel_verzoekstatistiek (week, bronorganisatie, status, voorkeurskanaal);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW datamodel_verzoekstatistiek;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0009_verzoek_registratiedatum_brin"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerzoekStatistiek",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "week",
+                    models.DateField(
+                        help_text="De eerste dag (maandag) van de week waarin de VERZOEKen zijn geregistreerd."
+                    ),
+                ),
+                (
+                    "bronorganisatie",
+                    vng_api_common.fields.RSINField(
+                        help_text="Het RSIN van de bronorganisatie van de VERZOEKen.",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("ontvangen", "Ontvangen"),
+                            ("in_behandeling", "In behandeling"),
+                            ("afgehandeld", "Afgehandeld"),
+                            ("afgewezen", "Afgewezen"),
+                            ("ingetrokken", "Ingetrokken"),
+                        ],
+                        help_text="De status van de VERZOEKen.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "voorkeurskanaal",
+                    models.CharField(
+                        help_text="Het voorkeurskanaal van de VERZOEKen.", max_length=50
+                    ),
+                ),
+                (
+                    "aantal",
+                    models.PositiveIntegerField(help_text="Het aantal VERZOEKen."),
+                ),
+            ],
+            options={
+                "verbose_name": "verzoekstatistiek",
+                "verbose_name_plural": "verzoekstatistieken",
+                "db_table": "datamodel_verzoekstatistiek",
+                "managed": False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
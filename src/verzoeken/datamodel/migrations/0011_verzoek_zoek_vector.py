@@ -0,0 +1,38 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:13
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE TRIGGER datamodel_verzoek_zoek_vector
+BEFORE INSERT OR UPDATE OF tekst ON datamodel_verzoek
+FOR EACH ROW EXECUTE PROCEDURE
+tsvector_update_trigger(zoek_vector, 'pg_catalog.dutch', tekst);
+"""
+
+DROP_TRIGGER = "DROP TRIGGER datamodel_verzoek_zoek_vector ON datamodel_verzoek;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0010_verzoekstatistiek"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="verzoek",
+            name="zoek_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="verzoek",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["zoek_vector"], name="verzoek_zoek_vector_gin"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from verzoeken.datamodel.data_migrations import FILL_ZOEK_VECTOR
+
+
+class Migration(migrations.Migration):
+
+    # the data migration commits per batch
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0011_verzoek_zoek_vector"),
+        ("utils", "0001_initial"),
+    ]
+
+    operations = [migrations.RunPython(FILL_ZOEK_VECTOR, migrations.RunPython.noop)]
@@ -0,0 +1,93 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+CASCADE_MODELS = [
+    "klantverzoek",
+    "objectverzoek",
+    "verzoekcontactmoment",
+    "verzoekproduct",
+]
+
+
+def set_on_delete(apps, schema_editor, on_delete: str) -> None:
+    Verzoek = apps.get_model("datamodel", "Verzoek")
+    for model_name in CASCADE_MODELS:
+        model = apps.get_model("datamodel", model_name)
+        table = schema_editor.quote_name(model._meta.db_table)
+        with schema_editor.connection.cursor() as cursor:
+            constraints = schema_editor.connection.introspection.get_constraints(
+                cursor, model._meta.db_table
+            )
+        for constraint, info in constraints.items():
+            if not info["foreign_key"] or info["columns"] != ["verzoek_id"]:
+                continue
+            schema_editor.execute(
+                f"ALTER TABLE {table} DROP CONSTRAINT "
+                f"{schema_editor.quote_name(constraint)}"
+            )
+            schema_editor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT "
+                f"{schema_editor.quote_name(constraint)} "
+                f"FOREIGN KEY (verzoek_id) "
+                f"REFERENCES {schema_editor.quote_name(Verzoek._meta.db_table)} (id) "
+                f"{on_delete} DEFERRABLE INITIALLY DEFERRED"
+            )
+
+
+def add_cascades(apps, schema_editor):
+    set_on_delete(apps, schema_editor, "ON DELETE CASCADE")
+
+
+def remove_cascades(apps, schema_editor):
+    set_on_delete(apps, schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0012_fill_zoek_vector"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="klantverzoek",
+            name="verzoek",
+            field=models.ForeignKey(
+                help_text="URL-referentie naar het VERZOEK.",
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                to="datamodel.Verzoek",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="objectverzoek",
+            name="verzoek",
+            field=models.ForeignKey(
+                help_text="URL-referentie naar het VERZOEK.",
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                to="datamodel.Verzoek",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoekcontactmoment",
+            name="verzoek",
+            field=models.ForeignKey(
+                help_text="URL-referentie naar het VERZOEK.",
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                to="datamodel.Verzoek",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="verzoekproduct",
+            name="verzoek",
+            field=models.ForeignKey(
+                help_text="URL-referentie naar het VERZOEK.",
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                to="datamodel.Verzoek",
+            ),
+        ),
+        # Django only emulates the on_delete behaviour, let the database
+        # cascade the deletes of the relations instead
+        migrations.RunPython(add_cascades, remove_cascades),
+    ]
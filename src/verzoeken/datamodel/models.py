@@ -1,19 +1,62 @@
 import uuid
+from typing import Set
 
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.fields import RSINField
 from vng_api_common.models import APIMixin
-from vng_api_common.utils import (
-    generate_unique_identification,
-    request_object_attribute,
-)
+from vng_api_common.utils import request_object_attribute
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from .constants import IndicatieMachtiging, KlantRol, ObjectTypes, VerzoekStatus
+from .fields import URLHashField
+from .identificatie import generate_identificatie, reserve_identificatie
+
+
+class VerzoekQuerySet(models.QuerySet):
+    def keten(self, verzoek: "Verzoek", max_diepte: int = 50) -> models.QuerySet:
+        """
+        Filter on the VERZOEKen that are chained to the VERZOEK.
+
+        The chain is followed in both directions through the
+        ``in_te_trekken_verzoek`` and ``aangevulde_verzoek`` references, up to
+        ``max_diepte`` steps away from the VERZOEK, with a single recursive
+        query.
+        """
+        table = connections[self.db].ops.quote_name(self.model._meta.db_table)
+        keten = RawSQL(
+            f"""
+            WITH RECURSIVE keten(id, in_te_trekken_id, aangevulde_id, diepte) AS (
+                SELECT id, in_te_trekken_verzoek_id, aangevulde_verzoek_id, 0
+                FROM {table}
+                WHERE id = %s
+            UNION
+                SELECT
+                    verzoek.id,
+                    verzoek.in_te_trekken_verzoek_id,
+                    verzoek.aangevulde_verzoek_id,
+                    keten.diepte + 1
+                FROM keten
+                JOIN {table} verzoek ON (
+                    verzoek.in_te_trekken_verzoek_id = keten.id
+                    OR verzoek.aangevulde_verzoek_id = keten.id
+                    OR verzoek.id = keten.in_te_trekken_id
+                    OR verzoek.id = keten.aangevulde_id
+                )
+                WHERE keten.diepte < %s
+            )
+            SELECT id FROM keten
+            """,
+            [verzoek.pk, max_diepte],
+        )
+        return self.filter(pk__in=keten)
 
 
 class Verzoek(APIMixin, models.Model):
@@ -63,7 +106,7 @@ class Verzoek(APIMixin, models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=VerzoekStatus,
+        choices=VerzoekStatus.choices,
         help_text="De waarden van de typering van de voortgang van afhandeling van een VERZOEK.",
     )
     in_te_trekken_verzoek = models.OneToOneField(
@@ -82,23 +125,62 @@ class Verzoek(APIMixin, models.Model):
         related_name="aanvullende_verzoek",
         help_text="URL-referentie naar het (eerdere) VERZOEK dat door dit VERZOEK wordt aangevuld.",
     )
+    # maintained by a database trigger from the tekst, see migration 0011
+    zoek_vector = SearchVectorField(null=True, editable=False)
+
+    objects = VerzoekQuerySet.as_manager()
 
     class Meta:
         unique_together = ("bronorganisatie", "identificatie")
         verbose_name = "verzoek"
         verbose_name_plural = "verzoeken"
+        indexes = [
+            # rows are added in registratiedatum order, so a block range index
+            # serves date range scans at a fraction of the size of a B-tree
+            BrinIndex(
+                fields=["registratiedatum"], name="verzoek_registratiedatum_brin"
+            ),
+            GinIndex(fields=["zoek_vector"], name="verzoek_zoek_vector_gin"),
+        ]
 
     def save(self, *args, **kwargs):
-        if not self.identificatie:
-            self.identificatie = generate_unique_identification(
-                self, "registratiedatum"
-            )
+        if self.identificatie and not self._state.adding:
+            return super().save(*args, **kwargs)
 
-        super().save(*args, **kwargs)
+        # the lock on the sequence is held until the verzoek is saved, see
+        # ``identificatie``
+        with transaction.atomic():
+            if not self.identificatie:
+                self.identificatie = generate_identificatie(self, "registratiedatum")
+            else:
+                reserve_identificatie(self)
+
+            super().save(*args, **kwargs)
 
     def unique_representation(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
 
+    def get_chained_pks(self) -> Set[int]:
+        """
+        Return the pks of this VERZOEK and the VERZOEKen that are deleted with it.
+
+        Those are the VERZOEKen that (indirectly) withdraw or supplement it.
+        """
+        pks = {self.pk}
+        new_pks = pks
+        while new_pks:
+            new_pks = (
+                set(
+                    Verzoek.objects.filter(
+                        Q(in_te_trekken_verzoek__in=new_pks)
+                        | Q(aangevulde_verzoek__in=new_pks)
+                    ).values_list("pk", flat=True)
+                )
+                - pks
+            )
+            pks |= new_pks
+        return pks
+
 
 class ObjectVerzoek(APIMixin, models.Model):
     uuid = models.UUIDField(
@@ -108,6 +190,7 @@ class ObjectVerzoek(APIMixin, models.Model):
         max_length=1000,
         help_text="URL-referentie naar het gerelateerde OBJECT (in een andere API).",
     )
+    object_hash = URLHashField(source="object", db_index=True)
     object_type = models.CharField(
         "objecttype",
         max_length=100,
@@ -116,14 +199,15 @@ class ObjectVerzoek(APIMixin, models.Model):
     )
     verzoek = models.ForeignKey(
         "datamodel.Verzoek",
-        on_delete=models.CASCADE,
+        # cascades in the database, see migration 0013
+        on_delete=models.DO_NOTHING,
         help_text="URL-referentie naar het VERZOEK.",
     )
 
     class Meta:
         verbose_name = "object-verzoek"
         verbose_name_plural = "object-verzoeken"
-        unique_together = ("verzoek", "object")
+        unique_together = ("verzoek", "object_hash")
 
 
 class VerzoekProduct(APIMixin, models.Model):
@@ -132,7 +216,8 @@ class VerzoekProduct(APIMixin, models.Model):
     )
     verzoek = models.ForeignKey(
         "datamodel.Verzoek",
-        on_delete=models.CASCADE,
+        # cascades in the database, see migration 0013
+        on_delete=models.DO_NOTHING,
         help_text="URL-referentie naar het VERZOEK.",
     )
     product = models.URLField(
@@ -140,6 +225,7 @@ class VerzoekProduct(APIMixin, models.Model):
         max_length=1000,
         help_text="URL-referentie naar het PRODUCT (in de Producten en Diensten API).",
     )
+    product_hash = URLHashField(source="product", null=True, db_index=True)
     product_code = models.CharField(
         max_length=20, blank=True, help_text="De unieke code van het PRODUCT."
     )
@@ -176,11 +262,12 @@ class VerzoekInformatieObject(models.Model):
         "aanvullende informatie biedt bij het VERZOEK.",
         max_length=1000,
     )
+    informatieobject_hash = URLHashField(source="informatieobject", db_index=True)
 
     class Meta:
         verbose_name = "verzoekinformatieobject"
         verbose_name_plural = "verzoekinformatieobjecten"
-        unique_together = (("verzoek", "informatieobject"),)
+        unique_together = (("verzoek", "informatieobject_hash"),)
 
     def __str__(self):
         return str(self.uuid)
@@ -202,18 +289,20 @@ class VerzoekContactMoment(models.Model):
     )
     verzoek = models.ForeignKey(
         "datamodel.Verzoek",
-        on_delete=models.CASCADE,
+        # cascades in the database, see migration 0013
+        on_delete=models.DO_NOTHING,
         help_text="URL-referentie naar het VERZOEK.",
     )
     contactmoment = models.URLField(
         max_length=1000,
         help_text=_("URL-referentie naar een CONTACTMOMENT (in Contactmoment API)"),
     )
+    contactmoment_hash = URLHashField(source="contactmoment", db_index=True)
 
     class Meta:
         verbose_name = "verzoekcontactmoment"
         verbose_name_plural = "verzoekcontactmomenten"
-        unique_together = ("verzoek", "contactmoment")
+        unique_together = ("verzoek", "contactmoment_hash")
 
     def __str__(self):
         return str(self.uuid)
@@ -229,12 +318,14 @@ class KlantVerzoek(models.Model):
     )
     verzoek = models.ForeignKey(
         "datamodel.Verzoek",
-        on_delete=models.CASCADE,
+        # cascades in the database, see migration 0013
+        on_delete=models.DO_NOTHING,
         help_text="URL-referentie naar het VERZOEK.",
     )
     klant = models.URLField(
         max_length=1000, help_text=_("URL-referentie naar een KLANT (in Klanten API)"),
     )
+    klant_hash = URLHashField(source="klant", db_index=True)
     rol = models.CharField(
         max_length=100,
         blank=True,
@@ -251,8 +342,56 @@ class KlantVerzoek(models.Model):
     class Meta:
         verbose_name = "klantverzoek"
         verbose_name_plural = "klantverzoeken"
-        unique_together = ("verzoek", "klant")
+        unique_together = ("verzoek", "klant_hash")
 
     def unique_representation(self):
         klant_id = self.klant.rstrip("/").split("/")[-1]
         return f"({self.verzoek.unique_representation()}) - {klant_id}"
+
+
+class VerzoekStatistiekQuerySet(models.QuerySet):
+    def refresh(self) -> None:
+        """
+        Recompute the statistics, without blocking reads.
+        """
+        connection = connections[router.db_for_write(self.model)]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {table}")
+
+
+class VerzoekStatistiek(models.Model):
+    """
+    Het aantal VERZOEKen per week, bronorganisatie, status en voorkeurskanaal.
+
+    Read-only, backed by a materialized view that is recomputed by the
+    ``refresh_statistieken`` management command.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    week = models.DateField(
+        help_text=_(
+            "De eerste dag (maandag) van de week waarin de VERZOEKen zijn "
+            "geregistreerd."
+        )
+    )
+    bronorganisatie = RSINField(
+        help_text=_("Het RSIN van de bronorganisatie van de VERZOEKen.")
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=VerzoekStatus.choices,
+        help_text=_("De status van de VERZOEKen."),
+    )
+    voorkeurskanaal = models.CharField(
+        max_length=50, help_text=_("Het voorkeurskanaal van de VERZOEKen.")
+    )
+    aantal = models.PositiveIntegerField(help_text=_("Het aantal VERZOEKen."))
+
+    objects = VerzoekStatistiekQuerySet.as_manager()
+
+    class Meta:
+        managed = False
+        db_table = "datamodel_verzoekstatistiek"
+        verbose_name = "verzoekstatistiek"
+        verbose_name_plural = "verzoekstatistieken"
@@ -0,0 +1,60 @@
+from django.db import connection
+from django.test import TestCase
+
+from ..models import (
+    KlantVerzoek,
+    ObjectVerzoek,
+    Verzoek,
+    VerzoekContactMoment,
+    VerzoekProduct,
+)
+from .factories import (
+    KlantVerzoekFactory,
+    ObjectVerzoekFactory,
+    VerzoekContactMomentFactory,
+    VerzoekFactory,
+    VerzoekProductFactory,
+)
+
+CASCADE_MODELS = [KlantVerzoek, ObjectVerzoek, VerzoekContactMoment, VerzoekProduct]
+
+
+class DatabaseCascadeTests(TestCase):
+    """
+    The relations are deleted by the database (see migration 0013).
+
+    The ON DELETE CASCADE only exists in the database, a migration that alters
+    the foreign keys drops it.
+    """
+
+    def test_foreign_keys_cascade(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT conrelid::regclass::text, confdeltype
+                FROM pg_constraint
+                WHERE contype = 'f' AND confrelid = %s::regclass
+                """,
+                [Verzoek._meta.db_table],
+            )
+            on_delete = dict(cursor.fetchall())
+
+        for model in CASCADE_MODELS:
+            with self.subTest(model=model):
+                self.assertEqual(on_delete.get(model._meta.db_table), "c")
+
+    def test_delete_verzoek(self):
+        verzoek = VerzoekFactory.create()
+        for factory in [
+            KlantVerzoekFactory,
+            ObjectVerzoekFactory,
+            VerzoekContactMomentFactory,
+            VerzoekProductFactory,
+        ]:
+            factory.create(verzoek=verzoek)
+
+        verzoek.delete()
+
+        for model in CASCADE_MODELS:
+            with self.subTest(model=model):
+                self.assertFalse(model.objects.exists())
@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+
+from verzoeken.utils.models import DataMigrationProgress
+
+from ..data_migrations import URL_HASH_MIGRATIONS, fill_remaining_url_hashes
+from ..fields import url_hash
+from ..models import VerzoekProduct
+from .factories import VerzoekProductFactory
+
+
+class FillRemainingURLHashesTests(TestCase):
+    def test_rows_written_after_the_migration(self):
+        for data_migration in URL_HASH_MIGRATIONS:
+            data_migration.run()
+        progress = DataMigrationProgress.objects.get(name="datamodel.fill_product_hash")
+        self.assertIsNotNone(progress.finished)
+        # written by a pod running old code
+        verzoek_product = VerzoekProductFactory.create()
+        VerzoekProduct.objects.filter(pk=verzoek_product.pk).update(product_hash=None)
+
+        with connection.schema_editor() as schema_editor:
+            fill_remaining_url_hashes(apps, schema_editor)
+
+        verzoek_product.refresh_from_db()
+        self.assertEqual(
+            bytes(verzoek_product.product_hash), url_hash(verzoek_product.product)
+        )
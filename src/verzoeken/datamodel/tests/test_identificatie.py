@@ -0,0 +1,158 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from django.db import IntegrityError, connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import make_aware
+
+from ..models import Verzoek
+from .factories import VerzoekFactory
+
+BRONORGANISATIE = "517439943"
+
+
+def drop_sequences():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname FROM pg_class WHERE relkind = 'S' AND relname LIKE %s",
+            [f"%\\_identificatie\\_{BRONORGANISATIE}\\_%"],
+        )
+        for (sequence,) in cursor.fetchall():
+            cursor.execute(f"DROP SEQUENCE {connection.ops.quote_name(sequence)}")
+
+
+class IdentificatieTests(TestCase):
+    def test_numbers_per_bronorganisatie_and_year(self):
+        registratiedatum = make_aware(datetime(2019, 6, 1))
+
+        verzoek1 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE, registratiedatum=registratiedatum
+        )
+        verzoek2 = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE, registratiedatum=registratiedatum
+        )
+        other_year = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE,
+            registratiedatum=make_aware(datetime(2020, 1, 1)),
+        )
+        other_organisation = VerzoekFactory.create(
+            bronorganisatie="111222333", registratiedatum=registratiedatum
+        )
+
+        self.assertEqual(verzoek1.identificatie, "VERZOEK-2019-0000000001")
+        self.assertEqual(verzoek2.identificatie, "VERZOEK-2019-0000000002")
+        self.assertEqual(other_year.identificatie, "VERZOEK-2020-0000000001")
+        self.assertEqual(other_organisation.identificatie, "VERZOEK-2019-0000000001")
+
+    def test_continues_after_issued_numbers(self):
+        registratiedatum = make_aware(datetime(2019, 6, 1))
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE,
+            registratiedatum=registratiedatum,
+            identificatie="VERZOEK-2019-0000000041",
+        )
+
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE, registratiedatum=registratiedatum
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2019-0000000042")
+
+    def test_skips_given_numbers(self):
+        registratiedatum = make_aware(datetime(2019, 6, 1))
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE, registratiedatum=registratiedatum
+        )
+        VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE,
+            registratiedatum=registratiedatum,
+            identificatie="VERZOEK-2019-0000000050",
+        )
+
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE, registratiedatum=registratiedatum
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2019-0000000051")
+
+    def test_update_leaves_sequence_alone(self):
+        verzoek = VerzoekFactory.create(
+            bronorganisatie=BRONORGANISATIE,
+            registratiedatum=make_aware(datetime(2019, 6, 1)),
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            verzoek.save()
+
+        self.assertEqual(len(context), 1, [query["sql"] for query in context])
+
+    def test_bronorganisatie_not_an_rsin(self):
+        verzoek = VerzoekFactory.create(
+            bronorganisatie="a'b\"c", registratiedatum=make_aware(datetime(2019, 6, 1))
+        )
+
+        self.assertEqual(verzoek.identificatie, "VERZOEK-2019-0000000001")
+
+
+class ConcurrentIdentificatieTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        drop_sequences()
+        self.addCleanup(drop_sequences)
+
+    def test_no_duplicates(self):
+        def create_verzoeken(count: int) -> None:
+            try:
+                for _ in range(count):
+                    VerzoekFactory.create(bronorganisatie=BRONORGANISATIE)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for future in [executor.submit(create_verzoeken, 25) for _ in range(16)]:
+                future.result()
+
+        identificaties = Verzoek.objects.values_list("identificatie", flat=True)
+        self.assertEqual(len(identificaties), 400)
+        self.assertEqual(len(set(identificaties)), 400)
+
+    def test_given_numbers_never_handed_out(self):
+        registratiedatum = make_aware(datetime(2019, 6, 1))
+
+        def create_verzoeken(count: int) -> None:
+            try:
+                for _ in range(count):
+                    VerzoekFactory.create(
+                        bronorganisatie=BRONORGANISATIE,
+                        registratiedatum=registratiedatum,
+                    )
+            finally:
+                connections.close_all()
+
+        def give_identificaties() -> int:
+            given = 0
+            try:
+                for number in range(10, 400, 10):
+                    try:
+                        VerzoekFactory.create(
+                            bronorganisatie=BRONORGANISATIE,
+                            registratiedatum=registratiedatum,
+                            identificatie=f"VERZOEK-2019-{number:010d}",
+                        )
+                    except IntegrityError:
+                        # handed out already, rejected like any duplicate
+                        continue
+                    given += 1
+            finally:
+                connections.close_all()
+            return given
+
+        with ThreadPoolExecutor(max_workers=9) as executor:
+            # a generated number that was given fails with an IntegrityError
+            futures = [executor.submit(create_verzoeken, 25) for _ in range(8)]
+            given = executor.submit(give_identificaties).result()
+            for future in futures:
+                future.result()
+
+        self.assertEqual(Verzoek.objects.count(), 200 + given)
@@ -0,0 +1,40 @@
+from django.db import IntegrityError
+from django.test import TestCase
+
+from ..fields import url_hash
+from ..models import KlantVerzoek, VerzoekProduct
+from .factories import KlantVerzoekFactory, VerzoekFactory
+
+KLANT = "http://some.klanten.nl/api/v1/klanten/12345"
+
+
+class URLHashTests(TestCase):
+    def test_hash_set_on_save(self):
+        klantverzoek = KlantVerzoekFactory.create(klant=KLANT)
+
+        klantverzoek.refresh_from_db()
+        self.assertEqual(bytes(klantverzoek.klant_hash), url_hash(KLANT))
+        self.assertEqual(len(klantverzoek.klant_hash), 16)
+
+    def test_hash_set_on_bulk_create(self):
+        verzoek = VerzoekFactory.create()
+
+        KlantVerzoek.objects.bulk_create([KlantVerzoek(verzoek=verzoek, klant=KLANT)])
+
+        self.assertTrue(
+            KlantVerzoek.objects.filter(klant_hash=url_hash(KLANT)).exists()
+        )
+
+    def test_no_hash_for_empty_url(self):
+        verzoek_product = VerzoekProduct.objects.create(
+            verzoek=VerzoekFactory.create(), product_code="ABC"
+        )
+
+        verzoek_product.refresh_from_db()
+        self.assertIsNone(verzoek_product.product_hash)
+
+    def test_unique_per_verzoek(self):
+        klantverzoek = KlantVerzoekFactory.create(klant=KLANT)
+
+        with self.assertRaises(IntegrityError):
+            KlantVerzoekFactory.create(verzoek=klantverzoek.verzoek, klant=KLANT)
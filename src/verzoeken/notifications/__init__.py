@@ -0,0 +1,4 @@
+"""
+Queue outgoing notifications and deliver them outside of the request cycle.
+"""
+default_app_config = "verzoeken.notifications.apps.NotificationsConfig"
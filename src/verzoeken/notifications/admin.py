@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import QueuedNotification
+
+
+@admin.register(QueuedNotification)
+class QueuedNotificationAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "created", "scheduled", "attempts", "failed"]
+    list_filter = ["failed"]
+    readonly_fields = ["message", "created", "attempts", "last_error"]
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    name = "verzoeken.notifications"
+    # the label "notifications" is taken by vng_api_common.notifications
+    label = "verzoeken_notifications"
@@ -0,0 +1,87 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from vng_api_common.notifications.models import NotificationsConfig
+
+from .models import QueuedNotification
+
+logger = logging.getLogger(__name__)
+
+# maximum delay between two delivery attempts of the same notification
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    return min(timedelta(seconds=2 ** attempts), MAX_RETRY_DELAY)
+
+
+def send(client, notification: QueuedNotification) -> Optional[Exception]:
+    try:
+        client.create("notificaties", notification.message)
+    except Exception as exc:
+        logger.warning(
+            "Could not deliver notification %s to %s",
+            notification.pk,
+            client.base_url,
+            exc_info=True,
+        )
+        return exc
+    return None
+
+
+def deliver_batch(batch_size: int = None, concurrency: int = None) -> int:
+    """
+    Deliver one batch of due notifications.
+
+    The batch is locked for the duration of the delivery, so multiple workers
+    can empty the queue side by side. Returns the number of processed
+    notifications.
+    """
+    batch_size = batch_size or settings.NOTIFICATIONS_QUEUE_BATCH_SIZE
+    concurrency = concurrency or settings.NOTIFICATIONS_QUEUE_CONCURRENCY
+
+    with transaction.atomic():
+        batch: List[QueuedNotification] = list(
+            QueuedNotification.objects.due()
+            .select_for_update(skip_locked=True)
+            .order_by("pk")[:batch_size]
+        )
+        if not batch:
+            return 0
+
+        # hard-fail on incomplete configuration, like the synchronous variant
+        client = NotificationsConfig.get_client()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            errors = list(
+                executor.map(lambda notification: send(client, notification), batch)
+            )
+
+        delivered = [
+            notification.pk
+            for notification, error in zip(batch, errors)
+            if error is None
+        ]
+        QueuedNotification.objects.filter(pk__in=delivered).delete()
+
+        now = timezone.now()
+        for notification, error in zip(batch, errors):
+            if error is None:
+                continue
+            notification.attempts += 1
+            notification.last_error = str(error)
+            notification.scheduled = now + get_retry_delay(notification.attempts)
+            notification.failed = (
+                notification.attempts >= settings.NOTIFICATIONS_QUEUE_MAX_ATTEMPTS
+            )
+            notification.save(
+                update_fields=["attempts", "last_error", "scheduled", "failed"]
+            )
+
+    return len(batch)
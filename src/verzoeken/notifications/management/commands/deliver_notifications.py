@@ -0,0 +1,70 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...delivery import deliver_batch
+from ...models import QueuedNotification
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Deliver the queued notifications to the Notificaties API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Empty the queue once and exit, instead of polling forever.",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only report the queue depth and delivery lag.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATIONS_QUEUE_BATCH_SIZE,
+            help="Number of notifications claimed per batch.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.NOTIFICATIONS_QUEUE_CONCURRENCY,
+            help="Number of notifications delivered in parallel.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.NOTIFICATIONS_QUEUE_POLL_INTERVAL,
+            help="Seconds to wait before polling an empty queue again.",
+        )
+
+    def report(self) -> None:
+        stats = QueuedNotification.objects.stats()
+        message = "queue depth={depth} failed={failed} lag={lag:.1f}s".format(**stats)
+        logger.info(message)
+        if self.verbosity >= 1:
+            self.stdout.write(message)
+
+    def handle(self, **options):
+        self.verbosity = options["verbosity"]
+
+        if options["stats"]:
+            self.report()
+            return
+
+        while True:
+            processed = deliver_batch(
+                batch_size=options["batch_size"], concurrency=options["concurrency"]
+            )
+            if processed:
+                continue
+
+            self.report()
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,74 @@
+# Generated by Django 2.2.11 on 2026-10-19 10:56
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "message",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        help_text="The notification message, as it will be sent."
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The moment the notification was queued.",
+                    ),
+                ),
+                (
+                    "scheduled",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The earliest moment of the next delivery attempt.",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, help_text="The number of failed delivery attempts."
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        help_text="The error of the last failed delivery attempt.",
+                    ),
+                ),
+                (
+                    "failed",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Delivery is given up after too many failed attempts.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "queued notification",
+                "verbose_name_plural": "queued notifications",
+            },
+        ),
+    ]
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.fields import JSONField
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+# notifications that only signal that the resource changed, a burst of these
+# can be merged into a single notification
+COALESCABLE_ACTIONS = ("update", "partial_update")
+
+
+def merge_messages(queued: dict, message: dict) -> dict:
+    merged = dict(message)
+    # subscribers must still learn that the resource was created
+    if queued["actie"] == "create":
+        merged["actie"] = "create"
+    return merged
+
+
+class QueuedNotificationQuerySet(models.QuerySet):
+    def enqueue(self, message: dict) -> "QueuedNotification":
+        """
+        Queue a notification, merging it into a pending one if possible.
+
+        With a ``NOTIFICATIONS_COALESCE_WINDOW``, notifications are held back
+        for the window. Updates of the same resource arriving in that window
+        are merged into the held notification instead of being queued again.
+        """
+        window = settings.NOTIFICATIONS_COALESCE_WINDOW
+        if not window:
+            return self.create(message=message)
+
+        now = timezone.now()
+        if message["actie"] in COALESCABLE_ACTIONS:
+            with transaction.atomic():
+                # skip notifications that are being delivered right now
+                queued = (
+                    self.select_for_update(skip_locked=True)
+                    .filter(
+                        failed=False,
+                        attempts=0,
+                        scheduled__gt=now,
+                        message__kanaal=message["kanaal"],
+                        message__hoofdObject=message["hoofdObject"],
+                        message__resourceUrl=message["resourceUrl"],
+                    )
+                    .order_by("-pk")
+                    .first()
+                )
+                if queued is not None and queued.message["actie"] != "destroy":
+                    queued.message = merge_messages(queued.message, message)
+                    queued.save(update_fields=["message"])
+                    return queued
+
+        return self.create(
+            message=message, created=now, scheduled=now + timedelta(seconds=window)
+        )
+
+    def pending(self):
+        return self.filter(failed=False)
+
+    def due(self):
+        return self.pending().filter(scheduled__lte=timezone.now())
+
+    def stats(self) -> dict:
+        """
+        Report the queue depth and the delivery lag (in seconds) of the queue.
+        """
+        pending = self.pending().aggregate(
+            depth=models.Count("pk"), oldest=models.Min("created")
+        )
+        oldest = pending["oldest"]
+        return {
+            "depth": pending["depth"],
+            "failed": self.filter(failed=True).count(),
+            "lag": (timezone.now() - oldest).total_seconds() if oldest else 0.0,
+        }
+
+
+class QueuedNotification(models.Model):
+    """
+    A notification that still needs to be delivered to the Notificaties API.
+    """
+
+    message = JSONField(help_text=_("The notification message, as it will be sent."))
+    created = models.DateTimeField(
+        default=timezone.now, help_text=_("The moment the notification was queued.")
+    )
+    scheduled = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        help_text=_("The earliest moment of the next delivery attempt."),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, help_text=_("The number of failed delivery attempts.")
+    )
+    last_error = models.TextField(
+        blank=True, help_text=_("The error of the last failed delivery attempt.")
+    )
+    failed = models.BooleanField(
+        default=False,
+        help_text=_("Delivery is given up after too many failed attempts."),
+    )
+
+    objects = QueuedNotificationQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("queued notification")
+        verbose_name_plural = _("queued notifications")
+
+    def __str__(self):
+        return f"{self.message.get('actie')} {self.message.get('resourceUrl')}"
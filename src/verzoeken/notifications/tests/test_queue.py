@@ -0,0 +1,265 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url, reverse
+from zds_client import ClientError
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.models import Verzoek, VerzoekInformatieObject
+from verzoeken.datamodel.tests.factories import VerzoekFactory
+
+from ..delivery import deliver_batch
+from ..models import QueuedNotification
+
+INFORMATIEOBJECT = (
+    "http://some.drc.nl/api/v1/informatieobjecten/ed01f0f6-6caf-4729-a68a-93d98dbaea0b"
+)
+MESSAGE = {
+    "kanaal": "verzoeken",
+    "hoofdObject": "http://testserver/api/v1/verzoeken/1",
+    "resource": "verzoek",
+    "resourceUrl": "http://testserver/api/v1/verzoeken/1",
+    "actie": "create",
+    "aanmaakdatum": "2018-09-07T00:00:00Z",
+    "kenmerken": {"bronorganisatie": "423182687"},
+}
+
+
+@freeze_time("2018-09-07T00:00:00Z")
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_QUEUED=True)
+class QueueNotificationTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    @patch("zds_client.Client.from_url")
+    def test_create_verzoek_queues_notification(self, mock_client):
+        client = mock_client.return_value
+        url = get_operation_url("verzoek_create")
+        data = {
+            "bronorganisatie": "423182687",
+            "status": VerzoekStatus.ontvangen,
+            "tekst": "some text",
+        }
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        client.create.assert_not_called()
+
+        notification = QueuedNotification.objects.get()
+        verzoek_url = response.json()["url"]
+        self.assertEqual(
+            notification.message,
+            {
+                "kanaal": "verzoeken",
+                "hoofdObject": verzoek_url,
+                "resource": "verzoek",
+                "resourceUrl": verzoek_url,
+                "actie": "create",
+                "aanmaakdatum": "2018-09-07T00:00:00Z",
+                "kenmerken": {"bronorganisatie": "423182687"},
+            },
+        )
+
+    @patch(
+        "verzoeken.notifications.models.QueuedNotification.objects.enqueue",
+        side_effect=DatabaseError("queue unavailable"),
+    )
+    def test_create_verzoek_rolled_back_without_notification(self, mock_enqueue):
+        url = get_operation_url("verzoek_create")
+        data = {"bronorganisatie": "423182687", "status": VerzoekStatus.ontvangen}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(Verzoek.objects.exists())
+
+    @override_settings(NOTIFICATIONS_QUEUED=False)
+    @patch("zds_client.Client.from_url")
+    def test_queue_disabled_sends_directly(self, mock_client):
+        client = mock_client.return_value
+        url = get_operation_url("verzoek_create")
+        data = {"bronorganisatie": "423182687", "status": VerzoekStatus.ontvangen}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        client.create.assert_called_once()
+        self.assertFalse(QueuedNotification.objects.exists())
+
+
+@override_settings(
+    NOTIFICATIONS_DISABLED=False,
+    NOTIFICATIONS_QUEUED=True,
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+)
+class QueueNotificationTransactionTests(JWTAuthMixin, APITransactionTestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        # not a TestCase, the credentials aren't created by setUpTestData
+        self._create_credentials(
+            self.client_id,
+            self.secret,
+            heeft_alle_autorisaties=self.heeft_alle_autorisaties,
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+        )
+        super().setUp()
+
+    @patch("vng_api_common.validators.ResourceValidator.__call__")
+    @patch("verzoeken.sync.signals.get_client_auth")
+    @patch("verzoeken.sync.signals.Client.from_url")
+    def test_create_vio_committed_before_sync(self, mock_from_url, *mocks):
+        verzoek = VerzoekFactory.create()
+        visible = []
+
+        def create(resource, data):
+            # the DRC looks the relation up in this API, on another connection
+            def lookup():
+                try:
+                    return VerzoekInformatieObject.objects.filter(
+                        informatieobject=INFORMATIEOBJECT
+                    ).exists()
+                finally:
+                    connection.close()
+
+            with ThreadPoolExecutor(1) as executor:
+                visible.append(executor.submit(lookup).result())
+
+        mock_from_url.return_value.create.side_effect = create
+
+        response = self.client.post(
+            reverse(VerzoekInformatieObject),
+            {"verzoek": reverse(verzoek), "informatieobject": INFORMATIEOBJECT},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(visible, [True])
+        self.assertEqual(
+            QueuedNotification.objects.get().message["resource"],
+            "verzoekinformatieobject",
+        )
+
+
+@freeze_time("2018-09-07T00:00:00Z")
+@override_settings(NOTIFICATIONS_QUEUE_MAX_ATTEMPTS=2)
+@patch("zds_client.Client.from_url")
+class DeliverNotificationTests(TestCase):
+    def test_deliver_batch(self, mock_client):
+        client = mock_client.return_value
+        QueuedNotification.objects.bulk_create(
+            [QueuedNotification(message=MESSAGE) for _ in range(3)]
+        )
+
+        processed = deliver_batch(batch_size=2)
+
+        self.assertEqual(processed, 2)
+        self.assertEqual(client.create.call_count, 2)
+        client.create.assert_called_with("notificaties", MESSAGE)
+        self.assertEqual(QueuedNotification.objects.count(), 1)
+
+    def test_deliver_failure_is_retried(self, mock_client):
+        client = mock_client.return_value
+        client.create.side_effect = ClientError("nope")
+        notification = QueuedNotification.objects.create(message=MESSAGE)
+
+        deliver_batch()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.attempts, 1)
+        self.assertFalse(notification.failed)
+        self.assertGreater(notification.scheduled, notification.created)
+
+        # not due yet
+        self.assertEqual(deliver_batch(), 0)
+
+        with freeze_time("2018-09-07T00:00:02Z"):
+            deliver_batch()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.attempts, 2)
+        self.assertTrue(notification.failed)
+
+    def test_command_once(self, mock_client):
+        client = mock_client.return_value
+        QueuedNotification.objects.create(message=MESSAGE)
+        stdout = StringIO()
+
+        call_command("deliver_notifications", once=True, stdout=stdout)
+
+        client.create.assert_called_once_with("notificaties", MESSAGE)
+        self.assertFalse(QueuedNotification.objects.exists())
+        self.assertEqual(stdout.getvalue(), "queue depth=0 failed=0 lag=0.0s\n")
+
+    def test_stats(self, mock_client):
+        QueuedNotification.objects.create(message=MESSAGE)
+        QueuedNotification.objects.create(message=MESSAGE, failed=True)
+
+        with freeze_time("2018-09-07T00:00:30Z"):
+            stats = QueuedNotification.objects.stats()
+
+        self.assertEqual(stats, {"depth": 1, "failed": 1, "lag": 30.0})
+
+
+@freeze_time("2018-09-07T00:00:00Z")
+@override_settings(NOTIFICATIONS_COALESCE_WINDOW=5)
+class CoalesceNotificationTests(TestCase):
+    def test_updates_are_merged(self):
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "partial_update"})
+        with freeze_time("2018-09-07T00:00:03Z"):
+            QueuedNotification.objects.enqueue(
+                {**MESSAGE, "actie": "update", "aanmaakdatum": "2018-09-07T00:00:03Z"}
+            )
+
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.message["actie"], "update")
+        self.assertEqual(notification.message["aanmaakdatum"], "2018-09-07T00:00:03Z")
+        # the window is not extended by the merged notification
+        self.assertEqual(
+            notification.scheduled.isoformat(), "2018-09-07T00:00:05+00:00"
+        )
+
+    def test_update_is_merged_into_create(self):
+        QueuedNotification.objects.enqueue(MESSAGE)
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "partial_update"})
+
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.message["actie"], "create")
+
+    def test_not_merged(self):
+        other_resource = {
+            **MESSAGE,
+            "actie": "update",
+            "resourceUrl": "http://testserver/api/v1/verzoeken/2",
+            "hoofdObject": "http://testserver/api/v1/verzoeken/2",
+        }
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "update"})
+        QueuedNotification.objects.enqueue(other_resource)
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "destroy"})
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "update"})
+
+        self.assertEqual(QueuedNotification.objects.count(), 4)
+
+    def test_not_merged_after_window(self):
+        QueuedNotification.objects.enqueue({**MESSAGE, "actie": "update"})
+
+        with freeze_time("2018-09-07T00:00:05Z"):
+            QueuedNotification.objects.enqueue({**MESSAGE, "actie": "update"})
+
+        self.assertEqual(QueuedNotification.objects.count(), 2)
+
+    def test_notification_is_held_back(self):
+        QueuedNotification.objects.enqueue(MESSAGE)
+
+        self.assertFalse(QueuedNotification.objects.due().exists())
+        with freeze_time("2018-09-07T00:00:05Z"):
+            self.assertTrue(QueuedNotification.objects.due().exists())
@@ -0,0 +1,84 @@
+from contextlib import nullcontext
+from typing import Dict, List, Union
+
+from django.conf import settings
+from django.db import models, transaction
+
+from vng_api_common.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationUpdateMixin,
+)
+
+from .models import QueuedNotification
+
+
+class QueuedNotificationMixin:
+    """
+    Write notifications to the local queue instead of sending them directly.
+
+    Must be placed before the ``Notification*Mixin`` classes of
+    ``vng_api_common``, it replaces their synchronous ``notify``. The queue is
+    emptied by the ``deliver_notifications`` management command.
+
+    The resource is written in a transaction together with its queued
+    notification, in ``perform_create``, ``perform_update`` and
+    ``perform_destroy``. The rest of the request (like the validation against
+    remote APIs) runs outside of it, so no locks are held during remote calls.
+    Set ``notifications_atomic`` to ``False`` if the save itself calls a
+    remote API that looks the resource up in this API: the resource must be
+    committed before that call, and the notification is queued after it.
+    """
+
+    notifications_atomic = True
+
+    def queue_transaction(self):
+        if not self.notifications_atomic:
+            return nullcontext()
+        return transaction.atomic()
+
+    def perform_create(self, serializer):
+        if not settings.NOTIFICATIONS_QUEUED or not isinstance(
+            self, NotificationCreateMixin
+        ):
+            return super().perform_create(serializer)
+
+        with self.queue_transaction():
+            super().perform_create(serializer)
+            self.enqueue(serializer.data)
+
+    def perform_update(self, serializer):
+        if not settings.NOTIFICATIONS_QUEUED or not isinstance(
+            self, NotificationUpdateMixin
+        ):
+            return super().perform_update(serializer)
+
+        with self.queue_transaction():
+            super().perform_update(serializer)
+            self.enqueue(serializer.data)
+
+    def perform_destroy(self, instance):
+        if not settings.NOTIFICATIONS_QUEUED or not isinstance(
+            self, NotificationDestroyMixin
+        ):
+            return super().perform_destroy(instance)
+
+        # the message is built while the (main) resource still exists
+        data = self.get_serializer(instance).data
+        with self.queue_transaction():
+            super().perform_destroy(instance)
+            self.enqueue(data, instance=instance)
+
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if not settings.NOTIFICATIONS_QUEUED:
+            return super().notify(status_code, data, instance=instance)
+        # queued by the perform_* methods, together with the change
+
+    def enqueue(self, data: Union[List, Dict], instance: models.Model = None) -> None:
+        if settings.NOTIFICATIONS_DISABLED:
+            return
+
+        message = self.construct_message(data, instance=instance)
+        QueuedNotification.objects.enqueue(message)
@@ -1,4 +1,9 @@
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial
+from threading import local
+from typing import List
 
 from django.conf import settings
 from django.contrib.sites.models import Site
@@ -7,32 +12,62 @@ from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.urls import reverse
 
-from vng_api_common.models import APICredential
 from zds_client import Client
 
-from verzoeken.datamodel.models import VerzoekInformatieObject
+from verzoeken.api.auth import get_client_auth
+from verzoeken.datamodel.models import Verzoek, VerzoekInformatieObject
+from verzoeken.utils.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
+_deleted_remotely = local()
+
 
 class SyncError(Exception):
     pass
 
 
-def sync_create_vio(relation: VerzoekInformatieObject):
-    operation = "create"
-
-    # build the URL of the Verzoek
+def get_verzoek_url(verzoek: Verzoek) -> str:
     path = reverse(
         "verzoek-detail",
         kwargs={
             "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
-            "uuid": relation.verzoek.uuid,
+            "uuid": verzoek.uuid,
         },
     )
     domain = Site.objects.get_current().domain
     protocol = "https" if settings.IS_HTTPS else "http"
-    verzoek_url = f"{protocol}://{domain}{path}"
+    return f"{protocol}://{domain}{path}"
+
+
+@contextmanager
+def marked_for_delete(relations: List[VerzoekInformatieObject]):
+    """
+    Mark the VIOs as deleted while their remote relations are being deleted.
+
+    Marked VIOs do not show up when performing GET requests on the verzoeken,
+    allowing the validation in the DRC to pass.
+    """
+    cache_key = "vios_marked_for_delete"
+    cache = caches["drc_sync"]
+    uuids = [relation.uuid for relation in relations]
+
+    cache.set(cache_key, (cache.get(cache_key) or []) + uuids)
+    try:
+        yield
+    finally:
+        marked_vios = cache.get(cache_key) or []
+        for uuid in uuids:
+            if uuid in marked_vios:
+                marked_vios.remove(uuid)
+        cache.set(cache_key, marked_vios)
+
+
+def sync_create_vio(relation: VerzoekInformatieObject):
+    operation = "create"
+
+    # build the URL of the Verzoek
+    verzoek_url = get_verzoek_url(relation.verzoek)
 
     logger.info("Verzoek: %s", verzoek_url)
     logger.info("Informatieobject: %s", relation.informatieobject)
@@ -42,7 +77,7 @@ def sync_create_vio(relation: VerzoekInformatieObject):
     client = Client.from_url(relation.informatieobject)
 
     # TODO?
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client.auth = get_client_auth(relation.informatieobject)
 
     try:
         operation_function = getattr(client, operation)
@@ -63,16 +98,7 @@ def sync_delete_vio(relation: VerzoekInformatieObject):
     operation = "delete"
 
     # build the URL of the Verzoek
-    path = reverse(
-        "verzoek-detail",
-        kwargs={
-            "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
-            "uuid": relation.verzoek.uuid,
-        },
-    )
-    domain = Site.objects.get_current().domain
-    protocol = "https" if settings.IS_HTTPS else "http"
-    verzoek_url = f"{protocol}://{domain}{path}"
+    verzoek_url = get_verzoek_url(relation.verzoek)
 
     logger.info("Verzoek: %s", verzoek_url)
     logger.info("Informatieobject: %s", relation.informatieobject)
@@ -80,7 +106,7 @@ def sync_delete_vio(relation: VerzoekInformatieObject):
     # Define the remote resource with which we need to interact
     resource = "objectinformatieobject"
     client = Client.from_url(relation.informatieobject)
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client.auth = get_client_auth(relation.informatieobject)
 
     # Retrieve the url of the relation between the object and the
     response = client.list(resource, query_params={"object": verzoek_url})
@@ -99,6 +125,87 @@ def sync_delete_vio(relation: VerzoekInformatieObject):
         raise SyncError(f"Could not {operation} remote relation") from exc
 
 
+def sync_delete_vios(relations: List[VerzoekInformatieObject]):
+    """
+    Delete the remote relations of many VIOs, for example of a deleted VERZOEK.
+
+    The remote relations are looked up once per VERZOEK and DRC, instead of
+    once per VIO.
+    """
+    with marked_for_delete(relations):
+        _sync_delete_vios(relations)
+
+
+@contextmanager
+def remote_relations_deleted(relations: List[VerzoekInformatieObject]):
+    """
+    Skip the sync when the VIOs are deleted.
+
+    Use this after deleting their remote relations with ``sync_delete_vios``.
+    """
+    _deleted_remotely.pks = {relation.pk for relation in relations}
+    try:
+        yield
+    finally:
+        _deleted_remotely.pks = set()
+
+
+def delete_remote_relation(client: Client, relation_url: str) -> None:
+    operation = "delete"
+    try:
+        operation_function = getattr(client, operation)
+        operation_function("objectinformatieobject", url=relation_url)
+    except Exception as exc:
+        logger.error(f"Could not {operation} remote relation", exc_info=1)
+        raise SyncError(f"Could not {operation} remote relation") from exc
+
+
+def _sync_delete_vios(relations: List[VerzoekInformatieObject]):
+    resource = "objectinformatieobject"
+
+    grouped = defaultdict(list)
+    for relation in relations:
+        client = Client.from_url(relation.informatieobject)
+        grouped[(client.base_url, get_verzoek_url(relation.verzoek))].append(
+            (client, relation)
+        )
+
+    clients, lookups = [], []
+    for (_, verzoek_url), group in grouped.items():
+        logger.info("Verzoek: %s", verzoek_url)
+
+        client = group[0][0]
+        client.auth = get_client_auth(group[0][1].informatieobject)
+        clients.append(client)
+        lookups.append(
+            partial(client.list, resource, query_params={"object": verzoek_url})
+        )
+
+    # the lookups and then the deletes don't depend on each other, and are
+    # done concurrently
+    deletes = []
+    for client, group, remote_relations in zip(
+        clients, grouped.values(), run_concurrently(*lookups)
+    ):
+        relation_urls = {
+            remote_relation["informatieobject"]: remote_relation["url"]
+            for remote_relation in remote_relations
+        }
+
+        for _, relation in group:
+            logger.info("Informatieobject: %s", relation.informatieobject)
+            try:
+                relation_url = relation_urls[relation.informatieobject]
+            except KeyError as exc:
+                msg = "No relations found in DRC for this Verzoek"
+                logger.error(msg, exc_info=1)
+                raise IndexError(msg) from exc
+
+            deletes.append(partial(delete_remote_relation, client, relation_url))
+
+    run_concurrently(*deletes)
+
+
 @receiver(
     [post_save, pre_delete],
     sender=VerzoekInformatieObject,
@@ -107,25 +214,11 @@ def sync_delete_vio(relation: VerzoekInformatieObject):
 def sync_informatieobject_relation(
     sender, instance: VerzoekInformatieObject = None, **kwargs
 ):
-    cache_key = "vios_marked_for_delete"
-
     signal = kwargs["signal"]
     if signal is post_save and kwargs.get("created", False):
         sync_create_vio(instance)
-    elif signal is pre_delete:
-        # Add the uuid of the VerzoekInformatieObject to the list of vios that are
-        # marked for delete, causing them not to show up when performing
-        # GET requests on the verzoeken, allowing the validation in the DRC to pass
-        cache = caches["drc_sync"]
-        marked_vios = cache.get(cache_key)
-        if marked_vios:
-            cache.set(cache_key, marked_vios + [instance.uuid])
-        else:
-            cache.set(cache_key, [instance.uuid])
-
-        try:
+    elif signal is pre_delete and instance.pk not in getattr(
+        _deleted_remotely, "pks", ()
+    ):
+        with marked_for_delete([instance]):
             sync_delete_vio(instance)
-        finally:
-            marked_vios = cache.get(cache_key)
-            marked_vios.remove(instance.uuid)
-            cache.set(cache_key, marked_vios)
@@ -12,3 +12,7 @@ class VerzoekInformatieObjectSyncMixin:
         patcher_sync_delete = patch("verzoeken.sync.signals.sync_delete_vio")
         self.mocked_sync_delete_vio = patcher_sync_delete.start()
         self.addCleanup(patcher_sync_delete.stop)
+
+        patcher_sync_delete_many = patch("verzoeken.api.viewsets.sync_delete_vios")
+        self.mocked_sync_delete_vios = patcher_sync_delete_many.start()
+        self.addCleanup(patcher_sync_delete_many.stop)
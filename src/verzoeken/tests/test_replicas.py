@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url
+
+from verzoeken.datamodel.constants import VerzoekStatus
+from verzoeken.datamodel.models import Verzoek
+from verzoeken.utils.replicas import ReplicaRouter, use_replicas
+
+
+@override_settings(DATABASE_REPLICAS=["replica_0", "replica_1"])
+class ReplicaRouterTests(SimpleTestCase):
+    def test_read_from_primary_by_default(self):
+        router = ReplicaRouter()
+
+        self.assertIsNone(router.db_for_read(Verzoek))
+        self.assertEqual(router.db_for_write(Verzoek), "default")
+
+    def test_read_from_replica(self):
+        router = ReplicaRouter()
+
+        with use_replicas():
+            self.assertIn(router.db_for_read(Verzoek), ["replica_0", "replica_1"])
+            self.assertEqual(router.db_for_write(Verzoek), "default")
+
+        self.assertIsNone(router.db_for_read(Verzoek))
+
+    def test_migrate_only_primary(self):
+        router = ReplicaRouter()
+
+        self.assertTrue(router.allow_migrate("default", "datamodel"))
+        self.assertFalse(router.allow_migrate("replica_0", "datamodel"))
+
+
+@override_settings(DATABASE_REPLICAS=["default"])
+@patch("verzoeken.utils.replicas.use_replicas", wraps=use_replicas)
+class ReplicaRoutingMiddlewareTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        caches["db_routing"].clear()
+
+    def test_safe_request_reads_from_replica(self, mock_use_replicas):
+        response = self.client.get(get_operation_url("verzoek_list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_use_replicas.assert_called_once_with(True)
+
+    def test_client_pinned_to_primary_after_write(self, mock_use_replicas):
+        url = get_operation_url("verzoek_list")
+        data = {"bronorganisatie": "423182687", "status": VerzoekStatus.ontvangen}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_use_replicas.assert_not_called()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_use_replicas.assert_called_once_with(False)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_anonymous_request_reads_from_primary(self, mock_use_replicas):
+        self.client.credentials()
+
+        self.client.get(get_operation_url("verzoek_list"))
+
+        mock_use_replicas.assert_not_called()
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self, mock_use_replicas):
+        response = self.client.get(get_operation_url("verzoek_list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_use_replicas.assert_not_called()
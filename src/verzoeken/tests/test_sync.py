@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+
+from verzoeken.datamodel.tests.factories import (
+    VerzoekFactory,
+    VerzoekInformatieObjectFactory,
+)
+from verzoeken.sync.signals import get_verzoek_url, sync_delete_vios
+
+DRC1 = "http://some.drc.nl/api/v1/"
+DRC2 = "http://other.drc.nl/api/v1/"
+
+
+@patch("verzoeken.sync.signals.get_client_auth")
+@patch("verzoeken.sync.signals.Client")
+class SyncDeleteVIOsTests(TestCase):
+    def test_one_list_per_verzoek_and_drc(self, mock_client, *mocks):
+        clients = {DRC1: MagicMock(base_url=DRC1), DRC2: MagicMock(base_url=DRC2)}
+        mock_client.from_url.side_effect = lambda url: clients[
+            DRC1 if url.startswith(DRC1) else DRC2
+        ]
+
+        verzoek = VerzoekFactory.create()
+        vios = [
+            VerzoekInformatieObjectFactory.create(
+                verzoek=verzoek, informatieobject=f"{drc}informatieobjecten/{i}"
+            )
+            for drc in [DRC1, DRC2]
+            for i in range(3)
+        ]
+        verzoek_url = get_verzoek_url(verzoek)
+        for drc, client in clients.items():
+            client.list.return_value = [
+                {
+                    "url": f"{vio.informatieobject}/relatie",
+                    "informatieobject": vio.informatieobject,
+                    "object": verzoek_url,
+                }
+                for vio in vios
+                if vio.informatieobject.startswith(drc)
+            ]
+
+        sync_delete_vios(vios)
+
+        for client in clients.values():
+            client.list.assert_called_once_with(
+                "objectinformatieobject", query_params={"object": verzoek_url}
+            )
+            self.assertEqual(client.delete.call_count, 3)
+        clients[DRC1].delete.assert_any_call(
+            "objectinformatieobject", url=f"{DRC1}informatieobjecten/0/relatie"
+        )
+
+    def test_missing_remote_relation(self, mock_client, *mocks):
+        mock_client.from_url.return_value.list.return_value = []
+        vio = VerzoekInformatieObjectFactory.create()
+
+        with self.assertRaises(IndexError):
+            sync_delete_vios([vio])
+
+        mock_client.from_url.return_value.delete.assert_not_called()
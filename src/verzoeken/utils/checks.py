@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.core.checks import Error, register
 from django.forms import ModelForm
 
@@ -40,3 +41,34 @@ def check_modelform_exclude(app_configs, **kwargs):
         )
 
     return errors
+
+
+@register()
+def check_admin_middleware(app_configs, **kwargs):
+    """
+    Check that the middleware of the admin is run for the admin.
+
+    The admin checks for this middleware are silenced, since they don't know
+    about the ``NON_API_MIDDLEWARE``.
+    """
+    errors = []
+
+    middleware = [
+        *settings.MIDDLEWARE,
+        *getattr(settings, "NON_API_MIDDLEWARE", []),
+    ]
+    for middleware_path in (
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.contrib.sessions.middleware.SessionMiddleware",
+    ):
+        if middleware_path not in middleware:
+            errors.append(
+                Error(
+                    "%s must be in MIDDLEWARE or NON_API_MIDDLEWARE in order to "
+                    "use the admin application." % middleware_path,
+                    id="utils.E002",
+                )
+            )
+
+    return errors
@@ -0,0 +1,49 @@
+"""
+Overlap the waits on remote APIs within a request.
+
+The remote calls of a request that don't depend on each other are run in a
+thread pool that is shared by the process, so the request waits for the
+slowest call instead of the sum of all calls. The calls must not use the
+database: a pool thread has its own connection, outside of the transaction of
+the request. Resolve the credentials and URLs before submitting the calls.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from django.conf import settings
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.REMOTE_CALL_WORKERS,
+                    thread_name_prefix="remote-call",
+                )
+    return _executor
+
+
+def run_concurrently(*calls: Callable) -> List:
+    """
+    Run the calls in the thread pool and return their results, in order.
+
+    The first exception (in the order of the calls) is raised after all calls
+    are done. Calls should not submit calls themselves, the pool is bounded.
+    """
+    if len(calls) <= 1 or settings.REMOTE_CALL_WORKERS <= 1:
+        return [call() for call in calls]
+
+    futures = [get_executor().submit(call) for call in calls]
+    # wait for all calls, so none is still running when the request ends
+    exceptions = [future.exception() for future in futures]
+    for exception in exceptions:
+        if exception is not None:
+            raise exception
+    return [future.result() for future in futures]
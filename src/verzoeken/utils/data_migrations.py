@@ -0,0 +1,101 @@
+"""
+Data migrations that process large tables in primary key batches.
+
+Every batch is committed on its own, together with the progress of the
+migration, so tables are never locked for long and an interrupted migration
+resumes after the last committed batch. Running it again processes the rows
+added after the last processed primary key. A data migration can be used as
+the code of a ``RunPython`` operation (of a migration with ``atomic = False``),
+and can be run out-of-band before the deploy with the ``run_data_migration``
+management command - the ``RunPython`` operation then only processes the rows
+written in the meantime.
+
+Data migrations are registered in the ``data_migrations`` module of an app::
+
+    fill_foo = DataMigration(
+        "app.fill_foo",
+        "app.Model",
+        process=lambda apps, batch: ...,
+        filters={"foo__isnull": True},
+    )
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+from django.apps import apps as global_apps
+from django.db import models, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+class DataMigration:
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        process: Callable,
+        filters: Optional[Dict] = None,
+        batch_size: int = 1000,
+    ):
+        self.name = name
+        self.model = model
+        self.process = process
+        self.filters = filters or {}
+        self.batch_size = batch_size
+
+        registry[name] = self
+
+    def __call__(self, apps, schema_editor) -> None:
+        self.run(apps=apps)
+
+    def get_queryset(self, apps) -> models.QuerySet:
+        model = apps.get_model(self.model)
+        return model._default_manager.filter(**self.filters).order_by("pk")
+
+    def run(
+        self,
+        apps=global_apps,
+        batch_size: Optional[int] = None,
+        report: Optional[Callable] = None,
+    ) -> None:
+        DataMigrationProgress = apps.get_model("utils", "DataMigrationProgress")
+        # a finished migration still picks up the rows written since, by pods
+        # that were running old code when it was run out-of-band
+        progress, _ = DataMigrationProgress.objects.get_or_create(name=self.name)
+
+        batch_size = batch_size or self.batch_size
+        queryset = self.get_queryset(apps)
+        remaining = queryset.filter(pk__gt=progress.last_pk).count()
+
+        while True:
+            with transaction.atomic():
+                batch: List[models.Model] = list(
+                    queryset.filter(pk__gt=progress.last_pk)[:batch_size]
+                )
+                if batch:
+                    self.process(apps, batch)
+                    progress.last_pk = batch[-1].pk
+                    progress.processed += len(batch)
+                else:
+                    progress.finished = timezone.now()
+                progress.save()
+
+            remaining = max(remaining - len(batch), 0)
+            message = "%s: processed %d of about %d rows" % (
+                self.name,
+                progress.processed,
+                progress.processed + remaining,
+            )
+            logger.info(message)
+            if report is not None:
+                report(message)
+
+            if not batch:
+                break
+
+    def reset(self, apps=global_apps) -> None:
+        DataMigrationProgress = apps.get_model("utils", "DataMigrationProgress")
+        DataMigrationProgress.objects.filter(name=self.name).delete()
@@ -0,0 +1,126 @@
+"""
+Liveness and readiness probes, answered before the rest of the middleware.
+
+``/_health/live`` only shows that the process handles requests.
+``/_health/ready`` also checks that the application is warmed up and that the
+database and the ``HEALTH_CHECK_CACHES`` can be reached, each within
+``HEALTH_CHECK_TIMEOUT`` seconds. The checks use their own connections, so a
+stuck database or Redis can't block the probe for longer than that, and the
+result is kept for a second, so the probes of a busy process don't add load.
+"""
+import json
+import logging
+import math
+import threading
+import time
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.http import HttpResponse
+
+from .warmup import is_warm
+
+logger = logging.getLogger(__name__)
+
+LIVE_PATH = "/_health/live"
+READY_PATH = "/_health/ready"
+
+READY_CACHE_SECONDS = 1
+
+_ready: Tuple[float, Dict[str, str]] = (0.0, {})
+_lock = threading.Lock()
+
+
+def check_database(alias: str = "default") -> None:
+    connection = connections[alias]
+    params = connection.get_connection_params()
+    # libpq only takes whole seconds
+    params["connect_timeout"] = math.ceil(settings.HEALTH_CHECK_TIMEOUT)
+    statement_timeout = int(settings.HEALTH_CHECK_TIMEOUT * 1000)
+    params["options"] = (
+        f"{params.get('options', '')} -c statement_timeout={statement_timeout}"
+    ).strip()
+
+    database = connection.get_new_connection(params)
+    try:
+        with database.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        database.close()
+
+
+def check_cache(alias: str) -> None:
+    cache = caches[alias]
+    # django-redis ignores the connection errors (IGNORE_EXCEPTIONS), so ping
+    # over a connection of its own
+    get_client = getattr(getattr(cache, "client", None), "get_client", None)
+    if get_client is None:
+        cache.get("health")
+        return
+
+    pool = get_client(write=False).connection_pool
+    redis = pool.connection_class(**pool.connection_kwargs)
+    redis.socket_timeout = settings.HEALTH_CHECK_TIMEOUT
+    redis.socket_connect_timeout = settings.HEALTH_CHECK_TIMEOUT
+    try:
+        redis.send_command("PING")
+        redis.read_response()
+    finally:
+        redis.disconnect()
+
+
+def run_checks() -> Dict[str, str]:
+    checks = {"database": check_database}
+    for alias in settings.HEALTH_CHECK_CACHES:
+        checks[f"cache {alias}"] = lambda alias=alias: check_cache(alias)
+
+    results = {"warmup": "ok" if is_warm() else "warming up"}
+    for name, check in checks.items():
+        try:
+            check()
+        except Exception as exc:
+            logger.warning("Health check of the %s failed: %s", name, exc)
+            results[name] = "unavailable"
+        else:
+            results[name] = "ok"
+    return results
+
+
+def get_readiness() -> Dict[str, str]:
+    global _ready
+
+    with _lock:
+        checked, results = _ready
+        if time.monotonic() - checked >= READY_CACHE_SECONDS:
+            results = run_checks()
+            _ready = (time.monotonic(), results)
+    return results
+
+
+class HealthCheckMiddleware:
+    """
+    Answer the probes, without the other middleware and the URL resolving.
+
+    Put it first in ``MIDDLEWARE``: the probes don't pass the host validation
+    (they use the IP of the pod), the HTTPS redirect or the authentication.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path_info == LIVE_PATH:
+            return HttpResponse("ok", content_type="text/plain")
+
+        if request.path_info == READY_PATH:
+            results = get_readiness()
+            ready = all(result == "ok" for result in results.values())
+            return HttpResponse(
+                json.dumps(results),
+                status=200 if ready else 503,
+                content_type="application/json",
+            )
+
+        return self.get_response(request)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import autodiscover_modules
+
+from ...data_migrations import registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a batched data migration out-of-band. An interrupted run resumes "
+        "after the last processed batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="The data migrations to run.")
+        parser.add_argument(
+            "--list", action="store_true", help="List the known data migrations."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, help="Number of rows processed per batch."
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Forget the progress and start from the first row.",
+        )
+
+    def handle(self, **options):
+        autodiscover_modules("data_migrations")
+
+        if options["list"] or not options["names"]:
+            for name in sorted(registry):
+                self.stdout.write(name)
+            return
+
+        unknown = set(options["names"]) - set(registry)
+        if unknown:
+            raise CommandError(f"Unknown data migration(s): {', '.join(unknown)}")
+
+        for name in options["names"]:
+            migration = registry[name]
+            if options["reset"]:
+                migration.reset()
+            migration.run(batch_size=options["batch_size"], report=self.stdout.write)
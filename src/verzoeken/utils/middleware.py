@@ -0,0 +1,92 @@
+"""
+Skip the middleware of the admin and the other pages for API requests.
+
+API requests are authenticated with JWTs, so they don't need sessions, users,
+messages or CSRF protection. The ``NON_API_MIDDLEWARE`` only run for requests
+outside of the ``API_PATH_PREFIXES``, in place of the ``NonAPIMiddleware`` in
+``MIDDLEWARE``.
+"""
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+
+def is_api_request(request) -> bool:
+    return request.path_info.startswith(settings.API_PATH_PREFIXES)
+
+
+class NonAPIMiddleware:
+    """
+    Run the ``NON_API_MIDDLEWARE`` for all requests but API requests.
+
+    The middleware chain is built like ``BaseHandler.load_middleware`` does,
+    and the view, template response and exception hooks of the middleware are
+    called from the hooks of this middleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        handler = get_response
+        for middleware_path in reversed(settings.NON_API_MIDDLEWARE):
+            middleware = import_string(middleware_path)
+            try:
+                mw_instance = middleware(handler)
+            except MiddlewareNotUsed:
+                continue
+
+            if mw_instance is None:
+                raise ImproperlyConfigured(
+                    "Middleware factory %s returned None." % middleware_path
+                )
+
+            if hasattr(mw_instance, "process_view"):
+                self._view_middleware.insert(0, mw_instance.process_view)
+            if hasattr(mw_instance, "process_template_response"):
+                self._template_response_middleware.append(
+                    mw_instance.process_template_response
+                )
+            if hasattr(mw_instance, "process_exception"):
+                self._exception_middleware.append(mw_instance.process_exception)
+
+            handler = convert_exception_to_response(mw_instance)
+
+        self.non_api_chain = handler
+
+    def __call__(self, request):
+        if is_api_request(request):
+            return self.get_response(request)
+        return self.non_api_chain(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if is_api_request(request):
+            return None
+
+        for process_view in self._view_middleware:
+            response = process_view(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if is_api_request(request):
+            return response
+
+        for process_template_response in self._template_response_middleware:
+            response = process_template_response(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if is_api_request(request):
+            return None
+
+        for process_exception in self._exception_middleware:
+            response = process_exception(request, exception)
+            if response is not None:
+                return response
+        return None
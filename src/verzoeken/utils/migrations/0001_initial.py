@@ -0,0 +1,40 @@
+# Generated by Django 2.2.11 on 2026-10-19 11:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="DataMigrationProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+                (
+                    "last_pk",
+                    models.BigIntegerField(
+                        default=0, help_text="Primary key of the last processed row."
+                    ),
+                ),
+                ("processed", models.PositiveIntegerField(default=0)),
+                ("finished", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "data migration progress",
+                "verbose_name_plural": "data migration progress",
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class DataMigrationProgress(models.Model):
+    """
+    The progress of a batched data migration, see ``data_migrations``.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    last_pk = models.BigIntegerField(
+        default=0, help_text="Primary key of the last processed row."
+    )
+    processed = models.PositiveIntegerField(default=0)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "data migration progress"
+        verbose_name_plural = "data migration progress"
+
+    def __str__(self):
+        return self.name
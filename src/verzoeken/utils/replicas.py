@@ -0,0 +1,90 @@
+"""
+Route the reads of safe requests to the read replicas.
+
+Replicas are configured with the ``DB_REPLICAS`` environment variable,
+see ``verzoeken.conf.base``. Without replicas, everything here is a no-op.
+"""
+import random
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import SAFE_METHODS
+
+_state = threading.local()
+
+
+@contextmanager
+def use_replicas(enabled: bool = True):
+    previous = getattr(_state, "use_replicas", False)
+    _state.use_replicas = enabled
+    try:
+        yield
+    finally:
+        _state.use_replicas = previous
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if settings.DATABASE_REPLICAS and getattr(_state, "use_replicas", False):
+            return random.choice(settings.DATABASE_REPLICAS)
+        return None
+
+    def db_for_write(self, model, **hints) -> str:
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, **hints) -> bool:
+        return db == "default"
+
+
+def get_client_id(request) -> Optional[str]:
+    jwt_auth = getattr(request, "jwt_auth", None)
+    if jwt_auth is None:
+        return None
+
+    try:
+        return jwt_auth.client_id
+    except PermissionDenied:
+        # reported by the permission checks of the view
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Read from a replica for safe requests, with read-your-writes protection.
+
+    After a non-safe request, the client (identified by the JWT client ID) is
+    pinned to the primary for ``DATABASE_REPLICA_STICKY_SECONDS``, so it never
+    reads data older than its own writes because of replication lag. Requests
+    without a client ID, like those of the admin, always use the primary.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        client_id = get_client_id(request)
+        if client_id is None:
+            return self.get_response(request)
+
+        cache = caches[settings.DATABASE_REPLICA_CACHE]
+        pin_key = f"db_routing:pinned:{client_id}"
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            cache.set(pin_key, True, timeout=settings.DATABASE_REPLICA_STICKY_SECONDS)
+            return response
+
+        with use_replicas(not cache.get(pin_key, False)):
+            return self.get_response(request)
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from ..concurrency import run_concurrently
+
+
+class RunConcurrentlyTests(SimpleTestCase):
+    def test_results_in_order(self):
+        def call(result, delay):
+            time.sleep(delay)
+            return result
+
+        results = run_concurrently(
+            lambda: call("first", 0.05), lambda: call("second", 0)
+        )
+
+        self.assertEqual(results, ["first", "second"])
+
+    def test_calls_overlap(self):
+        barrier = threading.Barrier(3, timeout=1)
+
+        # would time out if the calls were run one after the other
+        results = run_concurrently(barrier.wait, barrier.wait, barrier.wait)
+
+        self.assertEqual(sorted(results), [0, 1, 2])
+
+    def test_first_exception_after_all_calls(self):
+        done = []
+
+        def fail(message):
+            raise ValueError(message)
+
+        def slow():
+            time.sleep(0.05)
+            done.append(True)
+
+        with self.assertRaisesMessage(ValueError, "first"):
+            run_concurrently(lambda: fail("first"), slow, lambda: fail("second"))
+
+        self.assertEqual(done, [True])
+
+    @override_settings(REMOTE_CALL_WORKERS=1)
+    def test_disabled(self):
+        results = run_concurrently(
+            lambda: threading.current_thread(), lambda: threading.current_thread()
+        )
+
+        self.assertEqual(results, [threading.current_thread()] * 2)
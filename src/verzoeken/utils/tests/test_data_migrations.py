@@ -0,0 +1,129 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from verzoeken.datamodel.fields import url_hash
+from verzoeken.datamodel.models import VerzoekProduct
+from verzoeken.datamodel.tests.factories import VerzoekProductFactory
+
+from ..data_migrations import DataMigration, registry
+from ..models import DataMigrationProgress
+
+
+def fill_product_hash(apps, batch):
+    for verzoek_product in batch:
+        verzoek_product.product_hash = url_hash(verzoek_product.product)
+    VerzoekProduct.objects.bulk_update(batch, ["product_hash"])
+
+
+class DataMigrationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        VerzoekProductFactory.create_batch(5)
+        VerzoekProduct.objects.update(product_hash=None)
+
+        self.migration = DataMigration(
+            "test.fill_product_hash",
+            "datamodel.VerzoekProduct",
+            process=fill_product_hash,
+            filters={"product_hash__isnull": True},
+            batch_size=2,
+        )
+        self.addCleanup(registry.pop, "test.fill_product_hash")
+
+    def test_run(self):
+        messages = []
+
+        self.migration.run(report=messages.append)
+
+        self.assertFalse(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).exists()
+        )
+        progress = DataMigrationProgress.objects.get(name="test.fill_product_hash")
+        self.assertEqual(progress.processed, 5)
+        self.assertIsNotNone(progress.finished)
+        self.assertEqual(
+            messages,
+            [
+                "test.fill_product_hash: processed 2 of about 5 rows",
+                "test.fill_product_hash: processed 4 of about 5 rows",
+                "test.fill_product_hash: processed 5 of about 5 rows",
+                "test.fill_product_hash: processed 5 of about 5 rows",
+            ],
+        )
+
+    def test_resume_after_interruption(self):
+        batches = []
+
+        def interrupted(apps, batch):
+            if batches:
+                raise KeyboardInterrupt
+            batches.append(batch)
+            fill_product_hash(apps, batch)
+
+        self.migration.process = interrupted
+        with self.assertRaises(KeyboardInterrupt):
+            self.migration.run()
+
+        # the first batch is committed
+        self.assertEqual(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).count(), 3
+        )
+        progress = DataMigrationProgress.objects.get(name="test.fill_product_hash")
+        self.assertEqual(progress.last_pk, batches[0][-1].pk)
+
+        self.migration.process = fill_product_hash
+        self.migration.run()
+
+        self.assertFalse(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).exists()
+        )
+        progress.refresh_from_db()
+        self.assertEqual(progress.processed, 5)
+
+    def test_run_again_processes_new_rows(self):
+        self.migration.run()
+        # written by a pod running old code after the migration was run
+        VerzoekProductFactory.create_batch(3)
+        VerzoekProduct.objects.filter(
+            pk__in=VerzoekProduct.objects.order_by("-pk")[:3].values("pk")
+        ).update(product_hash=None)
+
+        self.migration.run()
+
+        self.assertFalse(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).exists()
+        )
+        progress = DataMigrationProgress.objects.get(name="test.fill_product_hash")
+        self.assertEqual(progress.processed, 8)
+        self.assertEqual(progress.last_pk, VerzoekProduct.objects.latest("pk").pk)
+
+    def test_run_again_skips_processed_rows(self):
+        self.migration.run()
+        VerzoekProduct.objects.update(product_hash=None)
+
+        self.migration.run()
+
+        self.assertEqual(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).count(), 5
+        )
+        progress = DataMigrationProgress.objects.get(name="test.fill_product_hash")
+        self.assertEqual(progress.processed, 5)
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command(
+            "run_data_migration", "test.fill_product_hash", batch_size=10, stdout=stdout
+        )
+
+        self.assertFalse(
+            VerzoekProduct.objects.filter(product_hash__isnull=True).exists()
+        )
+        self.assertIn("processed 5 of about 5 rows", stdout.getvalue())
+
+    def test_command_unknown_migration(self):
+        with self.assertRaises(CommandError):
+            call_command("run_data_migration", "unknown")
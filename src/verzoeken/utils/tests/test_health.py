@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from redis.exceptions import ConnectionError
+
+from .. import health, warmup
+
+REDIS_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "drc_sync": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        # nothing listens on this port
+        "LOCATION": "redis://localhost:1",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
+}
+
+
+class HealthCheckTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        for name, value in [("_ready", (0.0, {})), ("is_warm", lambda: True)]:
+            patcher = patch.object(health, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_live(self):
+        # the host isn't in ALLOWED_HOSTS, the middleware isn't run
+        response = self.client.get(health.LIVE_PATH, HTTP_HOST="10.0.0.1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"ok")
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+
+    def test_ready(self):
+        response = self.client.get(health.READY_PATH, HTTP_HOST="10.0.0.1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"warmup": "ok", "database": "ok", "cache drc_sync": "ok"},
+        )
+
+    @patch.object(warmup, "_warm", False)
+    def test_not_ready_warming_up(self):
+        with patch.object(health, "is_warm", warmup.is_warm):
+            response = self.client.get(health.READY_PATH)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["warmup"], "warming up")
+
+    @patch(
+        "verzoeken.utils.health.check_database", side_effect=OperationalError("down")
+    )
+    def test_not_ready_database(self, mock_check_database):
+        with self.assertLogs(health.logger, "WARNING"):
+            response = self.client.get(health.READY_PATH)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["database"], "unavailable")
+
+    @override_settings(CACHES=REDIS_CACHES, HEALTH_CHECK_TIMEOUT=0.5)
+    def test_not_ready_redis(self):
+        with self.assertRaises(ConnectionError):
+            health.check_cache("drc_sync")
+
+        with self.assertLogs(health.logger, "WARNING"):
+            response = self.client.get(health.READY_PATH)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["cache drc_sync"], "unavailable")
+
+    def test_readiness_cached(self):
+        with patch("verzoeken.utils.health.run_checks", return_value={}) as mock_run:
+            self.client.get(health.READY_PATH)
+            self.client.get(health.READY_PATH)
+
+            self.assertEqual(mock_run.call_count, 1)
+
+            with patch(
+                "verzoeken.utils.health.time.monotonic",
+                return_value=health._ready[0] + health.READY_CACHE_SECONDS,
+            ):
+                self.client.get(health.READY_PATH)
+
+            self.assertEqual(mock_run.call_count, 2)
@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase
+from django.urls import reverse as django_reverse
+
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from verzoeken.datamodel.models import Verzoek
+
+
+class NonAPIMiddlewareTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_api_request(self):
+        response = self.client.get(reverse(Verzoek))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("API-version", response)
+        self.assertNotIn("X-Frame-Options", response)
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+
+
+class AdminMiddlewareTests(TestCase):
+    def test_admin_request(self):
+        user = get_user_model().objects.create_superuser(
+            "admin", "admin@example.com", "secret"
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(django_reverse("admin:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Frame-Options"], "SAMEORIGIN")
+        self.assertEqual(response.wsgi_request.user, user)
+
+    def test_admin_csrf_protection(self):
+        client = Client(enforce_csrf_checks=True)
+
+        response = client.post(
+            django_reverse("admin:login"), {"username": "admin", "password": "secret"}
+        )
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+import requests
+from vng_api_common.oas import fetcher
+
+from verzoeken.api.renderers import get_key_map
+from verzoeken.api.urls import router
+
+from .. import warmup
+
+
+class WarmUpTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        patcher = patch.object(warmup, "_warm", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch.dict(fetcher.cache, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(WARM_UP_FETCH_TIMEOUT=2)
+    @patch("verzoeken.api.views.get_schema_file")
+    @patch("verzoeken.utils.warmup.requests.get")
+    def test_warm_up(self, mock_get, mock_get_schema_file):
+        mock_get.return_value.content = b"openapi: 3.0.0\n"
+        mock_get.return_value.headers = {}
+        get_key_map.cache_clear()
+
+        warmup.warm_up()
+
+        self.assertTrue(warmup.is_warm())
+        serializers = {viewset.serializer_class for _, viewset, _ in router.registry}
+        self.assertEqual(get_key_map.cache_info().currsize, len(serializers))
+        mock_get_schema_file.assert_any_call(".json")
+        mock_get_schema_file.assert_any_call(".yaml")
+        mock_get.assert_called_once_with(settings.ZRC_API_SPEC, timeout=2)
+        self.assertEqual(fetcher.cache[settings.ZRC_API_SPEC], {"openapi": "3.0.0"})
+
+    @patch("verzoeken.api.views.get_schema_file")
+    @patch("verzoeken.utils.warmup.requests.get", side_effect=requests.Timeout)
+    def test_warm_up_remote_spec_unavailable(self, mock_get, mock_get_schema_file):
+        with self.assertLogs(warmup.logger, "WARNING"):
+            warmup.warm_up()
+
+        self.assertTrue(warmup.is_warm())
+        self.assertNotIn(settings.ZRC_API_SPEC, fetcher.cache)
@@ -0,0 +1,98 @@
+"""
+Warm up the application before it serves requests.
+
+Django builds most of its state lazily, on the first request that needs it:
+the URL resolvers, the fields of the serializers and the OpenAPI schemas. The
+WSGI module warms up when it's imported, which uWSGI does in the master
+process before forking the workers, so the workers share the warmed-up memory
+(copy-on-write) and none of them pays for it on its first request.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.urls import get_resolver
+
+import requests
+import yaml
+
+logger = logging.getLogger(__name__)
+
+_warm = False
+
+
+def is_warm() -> bool:
+    return _warm
+
+
+def resolve_routes() -> None:
+    def populate(resolver):
+        resolver.reverse_dict
+        for pattern in resolver.url_patterns:
+            if hasattr(pattern, "url_patterns"):
+                populate(pattern)
+
+    populate(get_resolver())
+
+
+def load_serializers() -> None:
+    # imported here, the WSGI module imports this before the settings are set up
+    from verzoeken.api.renderers import get_key_map
+    from verzoeken.api.urls import router
+
+    for _, viewset, _ in router.registry:
+        get_key_map(viewset.serializer_class)
+
+
+def fetch_spec(url: str) -> None:
+    """
+    Fetch the spec of a remote API into the ``SchemaFetcher`` of
+    vng_api_common, like ``SchemaFetcher.fetch`` but with a timeout: it would
+    keep the master process from starting if the API doesn't answer.
+    """
+    from vng_api_common.oas import fetcher
+
+    response = requests.get(url, timeout=settings.WARM_UP_FETCH_TIMEOUT)
+    response.raise_for_status()
+
+    spec = yaml.safe_load(response.content)
+    spec_version = response.headers.get(
+        "X-OAS-Version", spec.get("openapi", spec.get("swagger", ""))
+    )
+    if not spec_version.startswith("3.0"):
+        raise ValueError("Unsupported spec version: {}".format(spec_version))
+
+    fetcher.cache[url] = spec
+
+
+def load_schemas() -> None:
+    from verzoeken.api.views import get_schema_file
+
+    for format in (".json", ".yaml"):
+        get_schema_file(format)
+
+    # the specs of the remote APIs are fetched once per process
+    for url in (settings.ZRC_API_SPEC,):
+        try:
+            fetch_spec(url)
+        except Exception:
+            logger.warning("Could not fetch the API spec %s", url, exc_info=True)
+
+
+def warm_up() -> None:
+    global _warm
+
+    start = time.monotonic()
+    resolve_routes()
+    load_serializers()
+    load_schemas()
+
+    # the connections can't be shared with the forked workers
+    connections.close_all()
+    for cache in caches.all():
+        cache.close()
+
+    _warm = True
+    logger.info("Warmed up in %.2fs", time.monotonic() - start)
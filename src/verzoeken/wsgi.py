@@ -11,6 +11,7 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 from verzoeken.setup import setup_env
+from verzoeken.utils.warmup import warm_up
 
 
 def init_newrelic():
@@ -32,3 +33,4 @@ def init_newrelic():
 
 setup_env()
 application = get_wsgi_application()
+warm_up()